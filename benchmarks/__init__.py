@@ -0,0 +1 @@
+"""Offline and local benchmarks for the Fantrax auction monitor"""
@@ -0,0 +1,113 @@
+"""Bytes parsed by the element-walk fallback before and after de-duplication.
+
+Rebuilds every element's visible text from page_source.html offline (one line
+per element's text, like Selenium's element.text for this layout) and compares:
+
+- all:        every element with > 20 chars and a position code (old walk)
+- outermost:  pending_lexer.outermost_texts, skipping elements inside a kept one
+- rows:       only the .supertable__row containers
+
+    python -m benchmarks.dedupe [path/to/page_source.html]
+"""
+import argparse
+import time
+from html.parser import HTMLParser
+
+from fantrax_monitor.fetch import is_candidate_text
+from fantrax_monitor.pending_lexer import bid_identity, outermost_texts, parse_pending_text
+
+VOID_TAGS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track', 'wbr'}
+HIDDEN_TAGS = {'script', 'style', 'head', 'title', 'noscript', 'template'}
+
+class ElementTextBuilder(HTMLParser):
+    """Collects (classes, text) and the parent index for every element in document order"""
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.text_nodes = []
+        self.stack = []       # [tag, classes, first text node index, element index]
+        self.elements = []    # [classes, start, end]
+        self.parents = []     # parent's index in elements, -1 at the top
+        self.hidden = 0
+        self.merge_next = False   # text split only by a comment stays one line
+    
+    def handle_starttag(self, tag, attrs):
+        self.merge_next = False
+        if tag in VOID_TAGS:
+            return
+        classes = dict(attrs).get('class') or ''
+        self.parents.append(self.stack[-1][1] if self.stack else -1)
+        self.elements.append([classes, len(self.text_nodes), None])
+        self.stack.append((tag, len(self.elements) - 1))
+        if tag in HIDDEN_TAGS:
+            self.hidden += 1
+    
+    def handle_endtag(self, tag):
+        self.merge_next = False
+        # Close back to the matching open tag (tolerates unclosed children)
+        for depth in range(len(self.stack) - 1, -1, -1):
+            if self.stack[depth][0] == tag:
+                for open_tag, index in self.stack[depth:]:
+                    self.elements[index][2] = len(self.text_nodes)
+                    if open_tag in HIDDEN_TAGS:
+                        self.hidden -= 1
+                del self.stack[depth:]
+                return
+    
+    def handle_comment(self, data):
+        self.merge_next = bool(self.text_nodes)
+    
+    def handle_data(self, data):
+        data = data.strip()
+        if not data or self.hidden:
+            return
+        if self.merge_next:
+            self.text_nodes[-1] += ' ' + data
+        else:
+            self.text_nodes.append(data)
+        self.merge_next = False
+    
+    def element_texts(self):
+        for classes, start, end in self.elements:
+            end = len(self.text_nodes) if end is None else end
+            yield classes, '\n'.join(self.text_nodes[start:end])
+
+def parse_all(texts):
+    """Parse texts with the lexer, de-duplicating bids by row identity"""
+    seen = set()
+    for text in texts:
+        for record in parse_pending_text(text):
+            seen.add(bid_identity(record))
+    return seen
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('page', nargs='?', default='page_source.html')
+    args = parser.parse_args()
+    
+    builder = ElementTextBuilder()
+    with open(args.page, 'r', encoding='utf-8') as f:
+        builder.feed(f.read())
+    elements = list(builder.element_texts())
+    
+    candidates = [text for classes, text in elements if is_candidate_text(text)]
+    start = time.perf_counter()
+    outermost = outermost_texts(lambda index: elements[index][1], builder.parents, is_candidate_text)
+    dedupe_ms = (time.perf_counter() - start) * 1000
+    strategies = [
+        ('all', candidates),
+        ('outermost', outermost),
+        ('rows', [text for classes, text in elements if 'supertable__row' in classes.split()]),
+    ]
+    
+    print(f"{args.page}: {len(elements)} elements, {len(candidates)} candidate texts, "
+          f"outermost selection {dedupe_ms:.2f} ms")
+    for name, texts in strategies:
+        start = time.perf_counter()
+        bids = parse_all(texts)
+        elapsed = time.perf_counter() - start
+        print(f"  {name:<10} {len(texts):5d} texts  {sum(len(t) for t in texts):9d} bytes parsed"
+              f"  {elapsed * 1000:7.2f} ms  {len(bids)} bids")
+
+if __name__ == "__main__":
+    main()
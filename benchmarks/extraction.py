@@ -0,0 +1,63 @@
+"""Benchmark the element walks against the single-call and page_source extractions.
+
+Loads the saved page_source.html into a local Chrome so no Fantrax login is
+needed, then times every extraction path against the same DOM: the walk over
+all elements, the walk over the bid rows (ROW_SELECTOR, what the fallback
+uses when the table markup is there), one script call and page_source.
+
+    python -m benchmarks.extraction [path/to/page_source.html] [--runs N]
+"""
+import argparse
+import os
+import time
+from pathlib import Path
+
+from fantrax_monitor.chrome_driver import create_driver
+from fantrax_monitor.fetch import BY_CSS, ROW_SELECTOR, extract_pending_rows, walk_elements_for_players
+from fantrax_monitor.pending_html import parse_pending_html
+
+def time_call(func, driver, runs):
+    """Return (best seconds, last result) over several runs"""
+    best = None
+    result = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = func(driver)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('page', nargs='?', default='page_source.html')
+    parser.add_argument('--runs', type=int, default=3)
+    args = parser.parse_args()
+    
+    driver = create_driver(headless=True)
+    
+    try:
+        driver.get(Path(os.path.abspath(args.page)).as_uri())
+        element_count = driver.execute_script("return document.getElementsByTagName('*').length;")
+        row_count = len(driver.find_elements(BY_CSS, ROW_SELECTOR))
+        print(f"Loaded {args.page} ({element_count} elements, {row_count} bid rows)")
+        
+        walk_time, walk_players = time_call(lambda d: walk_elements_for_players(d, row_selector=None),
+                                            driver, args.runs)
+        row_time, row_players = time_call(walk_elements_for_players, driver, args.runs)
+        script_time, script_rows = time_call(extract_pending_rows, driver, args.runs)
+        source_time, source_rows = time_call(lambda d: parse_pending_html(d.page_source), driver, args.runs)
+        
+        print(f"Element walk:   {walk_time * 1000:9.1f} ms  {len(walk_players)} players  (up to {element_count + 2} WebDriver calls)")
+        print(f"Row walk:       {row_time * 1000:9.1f} ms  {len(row_players)} players  (~{row_count + 1} WebDriver calls)")
+        print(f"Script extract: {script_time * 1000:9.1f} ms  {len(script_rows)} rows     (1 WebDriver call)")
+        print(f"page_source:    {source_time * 1000:9.1f} ms  {len(source_rows)} rows     (1 WebDriver call, parsed offline)")
+        if script_time > 0:
+            print(f"Speedup over the element walk: {walk_time / script_time:.1f}x, over the row walk: "
+                  f"{row_time / script_time:.1f}x")
+        for row in script_rows:
+            print(f"  {row['player_name']} ({row['position']}) - {row['team']} - PTY {row['priority']} - {row['bid_time']}")
+    finally:
+        driver.quit()
+
+if __name__ == "__main__":
+    main()
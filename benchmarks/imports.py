@@ -0,0 +1,54 @@
+"""Import-time benchmark: what each fantrax_monitor module costs a cold interpreter.
+
+Imports every module in a fresh `python -X importtime` process and reports
+its cumulative import time and whether selenium, webdriver_manager or
+requests came along. The parser must stay under --budget milliseconds so
+tests, benchmarks and the http backend start instantly.
+
+    python -m benchmarks.imports [--repeat N] [--budget MS]
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+
+MODULES = ['fantrax_monitor.parse', 'fantrax_monitor.render', 'fantrax_monitor.notify',
+           'fantrax_monitor.fetch', 'fantrax_scraper']
+HEAVY = ['selenium', 'webdriver_manager', 'requests']
+
+def import_once(module):
+    """(cumulative microseconds, heavy packages loaded) for importing module in a new interpreter"""
+    check = f"import sys, {module}; print(','.join(name for name in {HEAVY!r} if name in sys.modules))"
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', check],
+                            capture_output=True, text=True, check=True)
+    cumulative = 0
+    for line in result.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        parts = [part.strip() for part in line.split(':', 1)[-1].split('|')]
+        if len(parts) == 3 and parts[2] == module:
+            cumulative = int(parts[1])
+    return cumulative, [name for name in result.stdout.strip().split(',') if name]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--budget', type=float, default=5.0, help="ms allowed for fantrax_monitor.parse")
+    args = parser.parse_args()
+    
+    print(f"Median of {args.repeat} cold imports:")
+    parse_ms = None
+    for module in MODULES:
+        runs = [import_once(module) for _ in range(args.repeat)]
+        ms = statistics.median(cumulative for cumulative, _ in runs) / 1000
+        heavy = runs[-1][1]
+        if module == 'fantrax_monitor.parse':
+            parse_ms = ms
+        print(f"  {module:<24} {ms:8.1f} ms  loads: {', '.join(heavy) or '-'}")
+    
+    if parse_ms is not None and parse_ms > args.budget:
+        print(f"❌ fantrax_monitor.parse takes {parse_ms:.1f} ms (budget {args.budget:.1f} ms)")
+        sys.exit(1)
+    print(f"✓ fantrax_monitor.parse within {args.budget:.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Microbenchmark: compiled single-pass lexer vs the line-window regex parsers.
+
+Runs every captured element text from martinez_analysis.json and
+scraped_auction_data.json through find_players_being_added and
+parse_auction_data (fantrax_monitor.parse) and pending_lexer.parse_pending_text.
+
+    python -m benchmarks.lexer [--repeat N]
+"""
+import argparse
+import json
+import time
+
+from fantrax_monitor.parse import find_players_being_added, parse_auction_data
+from fantrax_monitor.pending_lexer import parse_pending_text
+
+def load_texts():
+    texts = list(json.load(open('martinez_analysis.json'))['martinez_elements'])
+    texts += [element['text'] for element in json.load(open('scraped_auction_data.json'))]
+    return texts
+
+def time_parser(parser, texts, repeat):
+    """Best-of-repeat seconds for one pass over all texts"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in texts:
+            parser(text)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+    
+    texts = load_texts()
+    total_bytes = sum(len(text) for text in texts)
+    print(f"{len(texts)} texts, {total_bytes} characters, best of {args.repeat}")
+    
+    lexer_time = time_parser(parse_pending_text, texts, args.repeat)
+    for name, func in [('find_players_being_added', find_players_being_added),
+                       ('parse_auction_data', parse_auction_data),
+                       ('parse_pending_text', parse_pending_text)]:
+        seconds = time_parser(func, texts, args.repeat)
+        print(f"  {name:<26} {seconds * 1e6:9.1f} us/pass  {total_bytes / seconds / 1e6:7.2f} MB/s"
+              f"  {seconds / lexer_time:5.1f}x lexer")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Load test: the full get_auction_data() path against synthetic leagues.
+
+Serves generated leagues of increasing size from stub_server and times a
+complete run (login, fetch, parse, snapshot, save) for each. The http
+backend logs in through the stub's JSON login; the browser backend loads
+the stub's rendered pending page in a local Chrome, with a cached cookie
+standing in for the form login. Output files are written to a temporary
+directory, not the working tree.
+
+    python -m benchmarks.load [--backend http|browser] [--teams N] [--sizes 10 100 1000 5000]
+"""
+import argparse
+import io
+import os
+import tempfile
+import time
+from contextlib import redirect_stdout
+
+from fantrax_monitor import session_cache
+from fantrax_monitor.fetch import get_auction_data
+from fantrax_monitor.parse import parse_pending_transactions
+from fantrax_monitor.stub_server import start_stub_server
+from fantrax_monitor.synthetic_league import generate_league, render_recording
+
+def run_once(league, backend='http'):
+    """(seconds, players returned) for one get_auction_data() run against the league"""
+    server = start_stub_server(render_recording(league))
+    host, port = server.server_address[:2]
+    os.environ['FANTRAX_BASE_URL'] = f"http://{host}:{port}"
+    if backend == 'browser':
+        # The stub serves the page to anyone; a cached cookie skips the login form it doesn't have
+        session_cache.save_cookies([{'name': 'FX_RM', 'value': 'stub-session', 'domain': host, 'path': '/'}])
+    try:
+        with redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            players = get_auction_data(backend=backend)
+            elapsed = time.perf_counter() - start
+    finally:
+        server.shutdown()
+        server.server_close()
+    return elapsed, players
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--backend', choices=['http', 'browser'], default='http')
+    parser.add_argument('--teams', type=int, default=12)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 100, 1000, 5000])
+    args = parser.parse_args()
+    
+    os.environ.setdefault('FANTRAX_USERNAME', 'stub')
+    os.environ.setdefault('FANTRAX_PASSWORD', 'stub')
+    original_dir = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        try:
+            for bids in args.sizes:
+                league = generate_league(args.teams, bids, bids // 4)
+                elapsed, players = run_once(league, args.backend)
+                expected = len(parse_pending_transactions(league))
+                status = "✓" if len(players) == expected else f"❌ expected {expected}"
+                print(f"{bids:>6} bids: {elapsed * 1000:8.1f} ms  {len(players):>6} players  {status}")
+        finally:
+            os.chdir(original_dir)
+
+if __name__ == "__main__":
+    main()
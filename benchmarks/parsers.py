@@ -0,0 +1,131 @@
+"""Offline parser benchmark suite over the recorded page fixtures.
+
+Replays the captured pages (page_source.html, auction_response.html,
+martinez_analysis.json, scraped_auction_data.json, js_data_5.json) plus
+synthetic pending pages of 10, 100 and 1,000 bids through each parser and
+reports throughput, per-call latency percentiles and peak memory. The
+whole-page HTML parsers get the raw page_source.html and synthetic pages.
+Needs no network, browser or Fantrax login.
+
+    python -m benchmarks.parsers [--repeat N] [--json report.json]
+"""
+import argparse
+import json
+import time
+import tracemalloc
+
+from benchmarks.dedupe import ElementTextBuilder
+from fantrax_monitor.parse import find_deadline, find_players_being_added, parse_auction_data
+from fantrax_monitor.pending_html import parse_pending_html
+from fantrax_monitor.pending_lexer import parse_pending_text
+from fantrax_monitor.synthetic_league import generate_league, render_html, render_text
+
+PARSERS = [
+    ('find_players_being_added', find_players_being_added),
+    ('parse_auction_data', parse_auction_data),
+    ('parse_pending_text', parse_pending_text),
+    ('deadline_regex', find_deadline),
+]
+SYNTHETIC_SIZES = [10, 100, 1000]
+
+def full_html_parse(page):
+    """Every element's text from the whole page - the cost of not slicing out the table"""
+    builder = ElementTextBuilder()
+    builder.feed(page)
+    return list(builder.element_texts())
+
+HTML_PARSERS = [
+    ('parse_pending_html', parse_pending_html),
+    ('full_html_parse', full_html_parse),
+]
+
+def html_element_texts(path):
+    builder = ElementTextBuilder()
+    with open(path, 'r', encoding='utf-8') as f:
+        builder.feed(f.read())
+    return [text for classes, text in builder.element_texts() if text]
+
+def html_fixture_sets():
+    """name -> [whole page HTML]"""
+    with open('page_source.html', 'r', encoding='utf-8') as f:
+        page_source = f.read()
+    return {
+        'page_source.html': [page_source],
+        **{f'synthetic_{n}_bids.html': [render_html(generate_league(bids=n, drops=n // 4))] for n in SYNTHETIC_SIZES},
+    }
+
+def fixture_sets():
+    """name -> list of texts, one parser call per text"""
+    return {
+        'page_source.html': html_element_texts('page_source.html'),
+        'auction_response.html': html_element_texts('auction_response.html'),
+        'martinez_analysis.json': list(json.load(open('martinez_analysis.json'))['martinez_elements']),
+        'scraped_auction_data.json': [e['text'] for e in json.load(open('scraped_auction_data.json'))],
+        'js_data_5.json': ['\n'.join(json.load(open('js_data_5.json')))],
+        **{f'synthetic_{n}_bids': [render_text(generate_league(bids=n, drops=n // 4))] for n in SYNTHETIC_SIZES},
+    }
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+def measure(func, texts, repeat):
+    """Latency per call over repeat passes, throughput, and peak traced memory for one pass"""
+    latencies = []
+    total_bytes = sum(len(text) for text in texts)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            call_start = time.perf_counter()
+            func(text)
+            latencies.append(time.perf_counter() - call_start)
+    elapsed = time.perf_counter() - start
+    
+    tracemalloc.start()
+    for text in texts:
+        func(text)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    
+    latencies.sort()
+    return {
+        'calls': len(latencies),
+        'bytes_per_pass': total_bytes,
+        'throughput_mb_s': total_bytes * repeat / elapsed / 1e6 if elapsed else 0.0,
+        'p50_us': percentile(latencies, 0.50) * 1e6,
+        'p90_us': percentile(latencies, 0.90) * 1e6,
+        'p99_us': percentile(latencies, 0.99) * 1e6,
+        'peak_kb': peak / 1024,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--json', help="also write the results to this file")
+    args = parser.parse_args()
+    
+    results = {}
+    fixtures = [(fixture, texts, PARSERS) for fixture, texts in fixture_sets().items()]
+    fixtures += [(fixture, pages, HTML_PARSERS) for fixture, pages in html_fixture_sets().items()]
+    for fixture, texts, parsers in fixtures:
+        print(f"{fixture} ({len(texts)} texts, {sum(len(t) for t in texts)} chars)")
+        if not texts:
+            # auction_response.html is the Angular shell - nothing rendered to parse
+            print("  no element text - skipped")
+            continue
+        results.setdefault(fixture, {})
+        for name, func in parsers:
+            stats = measure(func, texts, args.repeat)
+            results[fixture][name] = stats
+            print(f"  {name:<26} {stats['throughput_mb_s']:8.2f} MB/s  p50 {stats['p50_us']:9.1f} us"
+                  f"  p90 {stats['p90_us']:9.1f} us  p99 {stats['p99_us']:9.1f} us  peak {stats['peak_kb']:8.1f} KB")
+    
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"✓ Wrote {args.json}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+"""Fantrax pending-auction monitor.
+
+    parse   - pending-page text, page_source and API JSON -> player dicts; deadlines
+    fetch   - browser (Selenium) and http backends, one scrape-and-save run
+    render  - console report, alert email bodies, auction_players.json / email_summary.txt
+    notify  - email config, subjects and SMTP delivery
+
+The modules they build on live here too:
+
+    parsing   - pending_lexer, pending_html
+    fetching  - fantrax_http, xhr_capture, chrome_driver, session_cache, recorder
+    state     - settings, snapshot_state, bid_history, diagnostics, timing, file_utils
+    delivery  - mail_transport, subscriptions
+    runs      - pipeline, auction_daemon, multi_league
+    offline   - stub_server, synthetic_league
+
+Nothing is imported here, so `from fantrax_monitor.parse import ...` loads
+only the parsers; selenium and webdriver-manager load when a browser
+session starts.
+"""
@@ -0,0 +1,116 @@
+"""Long-running monitor: one warm browser/session, polled on a deadline-aware schedule.
+
+    python fantrax_scraper.py --daemon [--backend http] [--email]
+"""
+import time
+from datetime import datetime
+
+from fantrax_monitor import snapshot_state
+from fantrax_monitor.fetch import load_credentials, make_session, record_history
+from fantrax_monitor.parse import central, find_deadline, parse_deadline
+from fantrax_monitor.render import print_changes, save_results
+from fantrax_monitor.settings import LEAGUE_ID
+
+# (hours left before the claim deadline, seconds between polls) - first match wins
+POLL_SCHEDULE = [
+    (3, 3 * 60),
+    (12, 15 * 60),
+    (24, 30 * 60),
+    (72, 2 * 3600),
+]
+IDLE_INTERVAL = 6 * 3600       # deadline is days away
+UNKNOWN_INTERVAL = 3600        # no deadline on the page (no claims, or not parsed)
+PROCESSING_INTERVAL = 15 * 60  # deadline passed - wait for the next claim period
+MAX_BACKOFF = 15 * 60
+
+def next_poll_interval(deadline, now=None):
+    """Seconds until the next poll given the claim deadline (an aware datetime or None)"""
+    if deadline is None:
+        return UNKNOWN_INTERVAL
+    
+    now = now or datetime.now(central())
+    remaining = (deadline - now).total_seconds()
+    if remaining <= 0:
+        return PROCESSING_INTERVAL
+    
+    interval = IDLE_INTERVAL
+    for hours, seconds in POLL_SCHEDULE:
+        if remaining <= hours * 3600:
+            interval = seconds
+            break
+    
+    # Always get one look at the final state just before claims process
+    if remaining > 60:
+        interval = min(interval, remaining - 60)
+    return max(60, interval)
+
+def run_daemon(backend='browser', league_id=LEAGUE_ID, email=False, max_polls=None):
+    """Poll until interrupted, restarting the browser/session after crashes"""
+    username, password = load_credentials()
+    if not username or not password:
+        print("Error: No credentials found")
+        return
+    
+    transport = None
+    email_config = None
+    subscribers = None
+    if email:
+        from fantrax_monitor.notify import load_email_config
+        from fantrax_monitor.mail_transport import transport_from_config
+        from fantrax_monitor.pipeline import send_alert
+        from fantrax_monitor.subscriptions import index_from_config
+        email_config = load_email_config()
+        # Subscriber filters are compiled once for the life of the daemon
+        subscribers = index_from_config(email_config)
+        # One SMTP connection for the life of the daemon; it reconnects if the server drops it
+        transport = transport_from_config(email_config) if email_config else None
+    
+    session = make_session(backend, username, password)
+    failures = 0
+    polls = 0
+    print(f"=== Fantrax Auction Monitor daemon ({backend}) ===")
+    
+    try:
+        while max_polls is None or polls < max_polls:
+            polls += 1
+            try:
+                players, raw_deadline = session.poll(league_id)
+            except Exception as e:
+                # Dead driver, expired session mid-request, network blip...
+                failures += 1
+                backoff = min(MAX_BACKOFF, 30 * 2 ** (failures - 1))
+                print(f"❌ Poll failed ({e}) - restarting session in {backoff}s")
+                time.sleep(backoff)
+                try:
+                    session.restart()
+                except Exception as restart_error:
+                    print(f"❌ Restart failed: {restart_error}")
+                continue
+            failures = 0
+            
+            auction_deadline = find_deadline(raw_deadline)
+            deadline = parse_deadline(auction_deadline)
+            change = snapshot_state.record_snapshot(league_id, auction_deadline, players,
+                                                    getattr(session, 'last_page_fingerprint', None))
+            record_history(league_id, auction_deadline, players, change)
+            if change.changed:
+                print_changes(change)
+                save_results(players, auction_deadline, change)
+            else:
+                print("✓ Pending bids unchanged")
+            if email_config:
+                # Full list first, then only what changed since the last email
+                send_alert(email_config, players, auction_deadline, transport, index=subscribers, league_id=league_id,
+                           deadline=deadline)
+            
+            interval = next_poll_interval(deadline)
+            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Next poll in {interval / 60:.0f} min")
+            if max_polls is None or polls < max_polls:
+                time.sleep(interval)
+    except KeyboardInterrupt:
+        print("Stopping daemon")
+    finally:
+        session.close()
+        if transport is not None:
+            transport.report()
+            transport.close()
@@ -0,0 +1,144 @@
+"""Every pending-bid snapshot, kept in a local SQLite database for trend queries.
+
+auction_players.json only holds the latest run. Each run appends its bids
+here (one transaction per run) so questions like "who got bid on most this
+month" or "when did Jo Adell first show up" are one indexed query:
+
+    python -m fantrax_monitor.bid_history top --since 2025-06-01
+    python -m fantrax_monitor.bid_history first "Jo Adell"
+    python -m fantrax_monitor.bid_history player "Jo Adell"
+"""
+import argparse
+import os
+import sqlite3
+import time
+from datetime import datetime
+
+from fantrax_monitor.pending_lexer import to_int
+
+HISTORY_DB = os.getenv('FANTRAX_HISTORY_DB', 'bid_history.db')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS bids (
+    id INTEGER PRIMARY KEY,
+    league TEXT NOT NULL,
+    player TEXT NOT NULL COLLATE NOCASE,
+    team TEXT,
+    position TEXT,
+    priority INTEGER,
+    bid INTEGER,
+    bid_time TEXT,
+    drop_player TEXT,
+    deadline TEXT,
+    seen_at TEXT NOT NULL,
+    claim_budget INTEGER,
+    fantasy_team TEXT
+);
+CREATE INDEX IF NOT EXISTS bids_player ON bids (player, seen_at);
+CREATE INDEX IF NOT EXISTS bids_deadline ON bids (deadline, league);
+CREATE INDEX IF NOT EXISTS bids_seen_at ON bids (seen_at);
+"""
+
+# Columns added after the first release; databases created before them get them on connect
+ADDED_COLUMNS = {'claim_budget': 'INTEGER', 'fantasy_team': 'TEXT'}
+
+def connect(path=HISTORY_DB):
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(SCHEMA)
+    columns = {row['name'] for row in conn.execute("PRAGMA table_info(bids)")}
+    for column, column_type in ADDED_COLUMNS.items():
+        if column not in columns:
+            conn.execute(f"ALTER TABLE bids ADD COLUMN {column} {column_type}")
+    return conn
+
+def record_bids(league_id, deadline, players, seen_at=None, path=HISTORY_DB):
+    """Append one snapshot's bids in a single transaction; returns rows written"""
+    seen_at = seen_at or datetime.now().isoformat(timespec='seconds')
+    rows = [(league_id, player['player_name'], player.get('team'), player.get('position'),
+             to_int(player.get('priority')), to_int(player.get('bid')), player.get('bid_time'),
+             player.get('drop_player'), deadline, seen_at, to_int(player.get('claim_budget')),
+             player.get('fantasy_team'))
+            for player in players if player.get('player_name')]
+    conn = connect(path)
+    try:
+        with conn:
+            conn.executemany("INSERT INTO bids (league, player, team, position, priority, bid, bid_time, "
+                             "drop_player, deadline, seen_at, claim_budget, fantasy_team) "
+                             "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+    finally:
+        conn.close()
+    return len(rows)
+
+def most_bid_players(since=None, until=None, league=None, limit=20, path=HISTORY_DB):
+    """Players by number of distinct claims (not polls) seen in [since, until)"""
+    where, params = [], []
+    for clause, value in (("seen_at >= ?", since), ("seen_at < ?", until), ("league = ?", league)):
+        if value:
+            where.append(clause)
+            params.append(value)
+    sql = ("SELECT player, COUNT(DISTINCT league || '|' || IFNULL(deadline, '') || '|' || IFNULL(bid_time, '')) AS claims, "
+           "MIN(seen_at) AS first_seen, MAX(seen_at) AS last_seen FROM bids"
+           + (" WHERE " + " AND ".join(where) if where else "")
+           + " GROUP BY player ORDER BY claims DESC, last_seen DESC LIMIT ?")
+    conn = connect(path)
+    try:
+        return [dict(row) for row in conn.execute(sql, params + [limit])]
+    finally:
+        conn.close()
+
+def first_seen(player, path=HISTORY_DB):
+    """The earliest row for a player (case-insensitive), or None"""
+    conn = connect(path)
+    try:
+        row = conn.execute("SELECT * FROM bids WHERE player = ? ORDER BY seen_at LIMIT 1", (player,)).fetchone()
+        return dict(row) if row else None
+    finally:
+        conn.close()
+
+def player_history(player, path=HISTORY_DB):
+    """One row per distinct claim on a player: when it was first and last seen"""
+    conn = connect(path)
+    try:
+        return [dict(row) for row in conn.execute(
+            "SELECT league, deadline, team, position, bid_time, drop_player, MAX(bid) AS bid, "
+            "MIN(claim_budget) AS claim_budget, MIN(seen_at) AS first_seen, MAX(seen_at) AS last_seen FROM bids WHERE player = ? "
+            "GROUP BY league, deadline, bid_time ORDER BY first_seen", (player,))]
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Query the pending-bid history")
+    parser.add_argument('--db', default=HISTORY_DB)
+    commands = parser.add_subparsers(dest='command', required=True)
+    top = commands.add_parser('top', help="players with the most claims")
+    top.add_argument('--since', default=datetime.now().strftime('%Y-%m-01'), help="ISO date (default: this month)")
+    top.add_argument('--until')
+    top.add_argument('--league')
+    top.add_argument('--limit', type=int, default=20)
+    commands.add_parser('first', help="when a player first appeared").add_argument('player')
+    commands.add_parser('player', help="every claim seen on a player").add_argument('player')
+    args = parser.parse_args()
+    
+    start = time.perf_counter()
+    if args.command == 'top':
+        rows = most_bid_players(args.since, args.until, args.league, args.limit, args.db)
+        print(f"Most-claimed players since {args.since}:")
+        for i, row in enumerate(rows, 1):
+            print(f"  {i:>2}. {row['player']:<28} {row['claims']:>4} claim(s)  last seen {row['last_seen']}")
+    elif args.command == 'first':
+        row = first_seen(args.player, args.db)
+        if row:
+            print(f"{row['player']} first seen {row['seen_at']} ({row['league']}, deadline {row['deadline']})")
+        else:
+            print(f"No bids on {args.player} in {args.db}")
+    else:
+        rows = player_history(args.player, args.db)
+        for row in rows:
+            print(f"  {row['first_seen']} -> {row['last_seen']}  {row['league']}  deadline {row['deadline']}  "
+                  f"bid {row['bid']}" + (f" of ${row['claim_budget']}" if row['claim_budget'] is not None else "")
+                  + (f"  dropping {row['drop_player']}" if row['drop_player'] else ""))
+        if not rows:
+            print(f"No bids on {args.player} in {args.db}")
+    print(f"({(time.perf_counter() - start) * 1000:.1f} ms)")
@@ -0,0 +1,130 @@
+"""Chrome startup for the browser backend: a cached driver binary and a lean profile.
+
+ChromeDriverManager().install() checks (and may download) a driver on every
+call. resolve_driver_path() remembers the binary it returned in
+chromedriver_path.json and reuses it while the installed Chrome version is
+unchanged. The lean profile skips images, media, fonts and the ad/analytics
+domains seen in page_source.html; set FANTRAX_LEAN_BROWSER=0 to load
+everything.
+"""
+import json
+import os
+import re
+import subprocess
+import threading
+import time
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+from fantrax_monitor.file_utils import write_json_atomic
+
+DRIVER_CACHE = os.getenv('FANTRAX_DRIVER_CACHE', 'chromedriver_path.json')
+CHROME_COMMANDS = ['google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser']
+WINDOWS_VERSION_KEYS = [r'HKEY_CURRENT_USER\Software\Google\Chrome\BLBeacon',
+                        r'HKEY_LOCAL_MACHINE\Software\Google\Chrome\BLBeacon']
+
+# Passed to CDP Network.setBlockedURLs; '*' matches any run of characters
+BLOCKED_URLS = [
+    # Images, media and web fonts - nothing the scraper reads
+    '*.png*', '*.jpg*', '*.jpeg*', '*.gif*', '*.webp*', '*.ico*',
+    '*.mp4*', '*.webm*', '*.mp3*', '*.woff*', '*.woff2*', '*.ttf*', '*.otf*',
+    '*fonts.gstatic.com*', '*fonts.googleapis.com*', '*fantraximg.com*',
+    # Ads and analytics (gaData/dataLayer in js_data_5.json)
+    '*googletagmanager.com*', '*google-analytics.com*', '*doubleclick.net*', '*googlesyndication.com*',
+    '*fundingchoicesmessages.google.com*', '*amazon-adsystem.com*', '*pub.network*', '*.ad.gt*',
+    '*ad-delivery.net*', '*crwdcntrl.net*', '*smartadserver.com*', '*colossusssp.com*', '*1rx.io*',
+    '*casalemedia.com*', '*onetag-sys.com*', '*rapidedge.io*', '*privacymanager.io*', '*demdex.net*',
+    '*hadronid.net*', '*confiant-integrations.net*',
+]
+
+PAGE_BYTES_JS = """
+const entries = performance.getEntriesByType('navigation').concat(performance.getEntriesByType('resource'));
+return entries.reduce((total, entry) => total + (entry.transferSize || 0), 0);
+"""
+
+_resolve_lock = threading.Lock()
+
+def installed_chrome_version():
+    """Installed Chrome's version string, or None if it can't be determined"""
+    commands = [[command, '--version'] for command in CHROME_COMMANDS]
+    if os.name == 'nt':
+        commands = [['reg', 'query', key, '/v', 'version'] for key in WINDOWS_VERSION_KEYS]
+    for command in commands:
+        try:
+            output = subprocess.run(command, capture_output=True, text=True, timeout=10).stdout
+        except (OSError, subprocess.SubprocessError):
+            continue
+        match = re.search(r'\d+\.\d+\.\d+\.\d+', output)
+        if match:
+            return match.group(0)
+    return None
+
+def resolve_driver_path(path=DRIVER_CACHE):
+    """chromedriver binary for the installed Chrome, downloading only when Chrome changed"""
+    with _resolve_lock:
+        chrome_version = installed_chrome_version()
+        try:
+            with open(path, 'r') as f:
+                cached = json.load(f)
+        except (FileNotFoundError, ValueError):
+            cached = {}
+        
+        if (chrome_version and cached.get('chrome_version') == chrome_version
+                and os.path.exists(cached.get('driver_path') or '')):
+            return cached['driver_path']
+        
+        driver_path = ChromeDriverManager().install()
+        if chrome_version:
+            write_json_atomic(path, {'chrome_version': chrome_version, 'driver_path': driver_path})
+        return driver_path
+
+def lean_enabled():
+    return os.getenv('FANTRAX_LEAN_BROWSER', '1') != '0'
+
+def chrome_options(headless, lean=True, performance_log=False):
+    options = webdriver.ChromeOptions()
+    if performance_log:
+        # Network.* events for xhr_capture.py
+        options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    if headless:
+        options.add_argument("--headless")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+    
+    if lean:
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_argument("--mute-audio")
+        for flag in ("--disable-extensions", "--disable-background-networking", "--disable-component-update",
+                     "--disable-default-apps", "--disable-sync", "--no-first-run"):
+            options.add_argument(flag)
+        options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.default_content_setting_values.notifications': 2,
+        })
+    return options
+
+def create_driver(headless=None, lean=None, performance_log=False):
+    """Start Chrome (headless on GitHub Actions by default) and report how long it took"""
+    headless = bool(os.getenv('GITHUB_ACTIONS')) if headless is None else headless
+    lean = lean_enabled() if lean is None else lean
+    
+    start = time.perf_counter()
+    driver_path = resolve_driver_path()
+    resolved = time.perf_counter()
+    driver = webdriver.Chrome(service=Service(driver_path), options=chrome_options(headless, lean, performance_log))
+    if lean or performance_log:
+        driver.execute_cdp_cmd('Network.enable', {})
+    if lean:
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URLS})
+    
+    print(f"✓ Chrome started in {time.perf_counter() - start:.2f}s "
+          f"(driver lookup {resolved - start:.2f}s, {'lean' if lean else 'full'} profile)")
+    return driver
+
+def page_load_bytes(driver):
+    """Bytes transferred for the current page and its resources (0 for cached/blocked ones)"""
+    try:
+        return int(driver.execute_script(PAGE_BYTES_JS) or 0)
+    except Exception:
+        return 0
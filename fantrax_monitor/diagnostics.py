@@ -0,0 +1,64 @@
+"""Level-gated diagnostics with an optional in-memory ring buffer.
+
+Parsers log per-candidate detail with logger.debug("%s ...", arg) so nothing
+is formatted unless a handler wants the record. Normal runs keep DEBUG off.
+Set FANTRAX_DIAG_BUFFER=N to hold the last N debug records in memory; they
+are written out (stderr and diagnostics.log) only when dump_diagnostics() is
+called because a run failed or found zero players. FANTRAX_LOG_LEVEL=DEBUG
+streams everything instead.
+"""
+import logging
+import os
+import sys
+from collections import deque
+
+logger = logging.getLogger('fantrax')
+DIAGNOSTICS_LOG = os.getenv('FANTRAX_DIAG_LOG', 'diagnostics.log')
+LOG_FORMAT = '%(asctime)s %(levelname)s %(name)s: %(message)s'
+
+class RingBufferHandler(logging.Handler):
+    """Keeps the last capacity records; formatting happens only in dump()"""
+    
+    def __init__(self, capacity):
+        super().__init__(logging.DEBUG)
+        self.records = deque(maxlen=capacity)
+    
+    def emit(self, record):
+        self.records.append(record)
+
+_ring_buffer = None
+
+def configure_logging():
+    """Set up the 'fantrax' logger once from FANTRAX_LOG_LEVEL / FANTRAX_DIAG_BUFFER"""
+    global _ring_buffer
+    if logger.handlers:
+        return logger
+    
+    level = getattr(logging, os.getenv('FANTRAX_LOG_LEVEL', 'WARNING').upper(), logging.WARNING)
+    stream = logging.StreamHandler()
+    stream.setLevel(level)
+    stream.setFormatter(logging.Formatter(LOG_FORMAT))
+    logger.addHandler(stream)
+    
+    capacity = int(os.getenv('FANTRAX_DIAG_BUFFER', '0') or 0)
+    if capacity > 0:
+        _ring_buffer = RingBufferHandler(capacity)
+        _ring_buffer.setFormatter(logging.Formatter(LOG_FORMAT))
+        logger.addHandler(_ring_buffer)
+        level = logging.DEBUG
+    logger.setLevel(level)
+    logger.propagate = False
+    return logger
+
+def dump_diagnostics(reason, path=DIAGNOSTICS_LOG):
+    """Write out the buffered debug records (if buffering is on) and say why"""
+    if _ring_buffer is None or not _ring_buffer.records:
+        return
+    print(f"⚠ {reason} - dumping {len(_ring_buffer.records)} buffered diagnostic records to {path}", file=sys.stderr)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(f"# {reason}\n")
+        for record in _ring_buffer.records:
+            line = _ring_buffer.format(record)
+            f.write(line + '\n')
+            sys.stderr.write(line + '\n')
+    _ring_buffer.records.clear()
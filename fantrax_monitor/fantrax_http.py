@@ -0,0 +1,144 @@
+"""Browserless Fantrax backend built on a pooled, keep-alive requests.Session.
+
+The pending page is an Angular app - fetching its URL only returns the empty
+shell (see auction_response.html) - so this talks to the same JSON endpoint
+the app itself calls (/fxpa/req) and builds the player dicts directly.
+The login message and the getPendingTransactions field names have not been
+checked against a real capture, so a response this module cannot read
+raises FantraxRequestError instead of looking like an empty league.
+
+Set FANTRAX_BASE_URL to point at stub_server.py for offline runs.
+"""
+import os
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from fantrax_monitor import session_cache
+from fantrax_monitor.parse import PendingPayloadError, parse_pending_transactions
+from fantrax_monitor.settings import LEAGUE_ID
+
+LOGIN_METHOD = "login"
+PENDING_METHOD = "getPendingTransactions"
+USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+              "(KHTML, like Gecko) Chrome/125.0 Safari/537.36")
+
+class FantraxRequestError(Exception):
+    """Fantrax answered, but not with the data we asked for"""
+
+def base_url():
+    return os.getenv('FANTRAX_BASE_URL', 'https://www.fantrax.com').rstrip('/')
+
+def create_session(pool_size=4):
+    """requests.Session with a keep-alive connection pool and light retries"""
+    session = requests.Session()
+    retry = Retry(total=2, backoff_factor=0.5, status_forcelist=[502, 503, 504], allowed_methods=None)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers.update({
+        'User-Agent': USER_AGENT,
+        'Accept': 'application/json',
+        'Connection': 'keep-alive',
+    })
+    # Save every response while recorder.py (or FANTRAX_RECORD) is recording
+    from fantrax_monitor.recorder import attach_session
+    return attach_session(session)
+
+def fxpa_request(session, method, data=None, league_id=None, timeout=15):
+    """POST one message to /fxpa/req and return its 'data' payload"""
+    params = {'leagueId': league_id} if league_id else None
+    payload = {'msgs': [{'method': method, 'data': data or {}}]}
+    response = session.post(f"{base_url()}/fxpa/req", params=params, json=payload, timeout=timeout)
+    response.raise_for_status()
+    
+    try:
+        body = response.json()
+    except ValueError:
+        raise FantraxRequestError(f"{method}: response was not JSON")
+    
+    if body.get('pageError'):
+        error = body['pageError']
+        raise FantraxRequestError(f"{method}: {error.get('title') or error.get('code') or error}")
+    
+    responses = body.get('responses') or []
+    if not responses:
+        raise FantraxRequestError(f"{method}: empty response")
+    return responses[0].get('data') or {}
+
+def login(session, username, password):
+    """Authenticate the session; Fantrax sets its auth cookies on the response"""
+    fxpa_request(session, LOGIN_METHOD, {'userOrEmail': username, 'password': password})
+
+def fetch_pending(session, league_id=LEAGUE_ID):
+    """Raw getPendingTransactions payload for every team in the league"""
+    return fxpa_request(session, PENDING_METHOD, {'leagueId': league_id, 'teamId': 'ALL_TEAMS'}, league_id=league_id)
+
+class HttpSession:
+    """A pooled requests.Session that stays logged in across polls"""
+    
+    def __init__(self, username, password, use_cache=True, cookie_cache=session_cache.COOKIE_CACHE):
+        self.username = username
+        self.password = password
+        self.session = None
+        self.use_cache = use_cache
+        self.cookie_cache = cookie_cache
+        self.logged_in = False
+    
+    def start(self):
+        self.session = create_session()
+        cookies = session_cache.load_cookies(self.cookie_cache) if self.use_cache else []
+        if cookies:
+            session_cache.apply_to_session(self.session, cookies)
+        self.logged_in = bool(cookies)
+    
+    def close(self):
+        if self.session is not None:
+            self.session.close()
+        self.session = None
+    
+    def restart(self):
+        self.close()
+        self.start()
+    
+    def login(self):
+        """Log in and cache the cookies for other sessions"""
+        if self.session is None:
+            self.start()
+        login(self.session, self.username, self.password)
+        self.logged_in = True
+        if self.use_cache:
+            session_cache.save_cookies(session_cache.session_cookies(self.session), self.cookie_cache)
+    
+    def poll(self, league_id=LEAGUE_ID):
+        """Fetch pending claims, logging in only when the cookies are missing or rejected
+
+        Returns (players, raw deadline text).
+        """
+        if self.session is None:
+            self.start()
+        
+        data = None
+        if self.logged_in:
+            try:
+                data = fetch_pending(self.session, league_id)
+            except (FantraxRequestError, requests.HTTPError):
+                print("Session rejected - logging in")
+                self.session.cookies.clear()
+                self.logged_in = False
+        
+        if data is None:
+            self.login()
+            data = fetch_pending(self.session, league_id)
+        
+        try:
+            return parse_pending_transactions(data), data.get('deadline')
+        except PendingPayloadError as e:
+            raise FantraxRequestError(f"{PENDING_METHOD}: {e}") from e
+
+def fetch_pending_players(username, password, league_id=LEAGUE_ID, use_cache=True):
+    """Fetch pending claims over HTTP once; returns (players, raw deadline text)"""
+    http_session = HttpSession(username, password, use_cache)
+    try:
+        return http_session.poll(league_id)
+    finally:
+        http_session.close()
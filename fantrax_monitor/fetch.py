@@ -0,0 +1,455 @@
+"""Fetchers: log in, load the pending page (browser) or call the API (http), and save a run.
+
+Selenium, webdriver-manager and chrome_driver are imported inside the
+browser code paths, so the HTTP backend never loads them. The locators
+below are spelled with selenium's By values for the same reason.
+"""
+import os
+from fantrax_monitor import bid_history, recorder, session_cache, snapshot_state
+from fantrax_monitor.diagnostics import dump_diagnostics
+from fantrax_monitor.fantrax_http import base_url
+from fantrax_monitor.parse import find_deadline
+from fantrax_monitor.pending_html import parse_pending_html
+from fantrax_monitor.pending_lexer import (POSITION_CODES, bid_identity, debug_logger, outermost_texts, parse_pending_text,
+                                          to_int, with_numbers)
+from fantrax_monitor.render import print_changes, save_results
+from fantrax_monitor.settings import LEAGUE_ID, load_config
+from fantrax_monitor.timing import PhaseTimer
+from fantrax_monitor.xhr_capture import capture_pending_players
+
+# selenium.webdriver.common.by.By values
+BY_CSS = 'css selector'
+BY_NAME = 'name'
+BY_XPATH = 'xpath'
+
+# Pulls every pending-transaction row out of the page in a single WebDriver call
+# instead of one round trip per element.
+PENDING_ROWS_JS = """
+const rows = [];
+document.querySelectorAll('.supertable--pending-transaction-table').forEach(table => {
+    const section = table.closest('pending-transactions-table') || table.parentElement;
+    const header = section ? section.querySelector('.sub-heading h5') : null;
+    const deadline = header ? header.textContent.trim() : null;
+    const budget = section ? section.querySelector('.single-header--sub-header b') : null;
+    table.querySelectorAll('.supertable__row').forEach(row => {
+        const cells = {};
+        row.querySelectorAll('.supertable__cell').forEach(cell => {
+            const head = cell.querySelector('.supertable__cell__head');
+            if (!head) return;
+            const input = cell.querySelector('input');
+            const label = head.textContent.trim().toUpperCase();
+            const value = input ? input.value : cell.textContent.replace(head.textContent, '');
+            cells[label.startsWith('SUBMITTED') ? 'SUBMITTED' : label] = value.trim();
+        });
+        const name = row.querySelector('.scorer__info__name');
+        const spans = row.querySelectorAll('.scorer__info__positions span');
+        const drop = row.querySelector('.supertable__cell--ptt--75-mobile .scorer__info__name');
+        rows.push({
+            player_name: name ? name.textContent.trim() : null,
+            position: spans.length > 0 ? spans[0].textContent.trim() : null,
+            team: spans.length > 1 ? spans[1].textContent.replace('-', '').trim() : null,
+            priority: cells['PTY'] || null,
+            bid: cells['BID'] || null,
+            bid_time: cells['SUBMITTED'] || null,
+            drop_player: drop ? drop.textContent.trim() : null,
+            deadline: deadline,
+            claim_budget: budget ? budget.textContent.replace('$', '').trim() || null : null
+        });
+    });
+});
+return rows;
+"""
+
+# The pending sections' text for the "page unchanged" fingerprint. innerText leaves
+# out <input> values, so the bid amounts are appended or a bid-only edit would be missed.
+PENDING_TEXT_JS = """
+const sections = Array.from(document.querySelectorAll('pending-transactions-table'));
+if (!sections.length) return '';
+const bids = sections.flatMap(section => Array.from(section.querySelectorAll('input')).map(input => input.value));
+return sections.map(section => section.innerText).join('\\n') + '\\nBIDS ' + bids.join(',');
+"""
+
+# Index of every element's parent in the querySelectorAll('*') list (-1 for the root),
+# so the element walk can skip descendants of a text it already kept
+ELEMENT_PARENTS_JS = """
+const all = Array.from(document.querySelectorAll('*'));
+const index = new Map(all.map((element, i) => [element, i]));
+return all.map(element => index.has(element.parentElement) ? index.get(element.parentElement) : -1);
+"""
+
+PENDING_BIDS_JS = """
+return Array.from(document.querySelectorAll('.supertable--pending-transaction-table .supertable__row'))
+    .map(row => { const input = row.querySelector('.cell-input--bid'); return input ? input.value : null; });
+"""
+
+def extract_pending_rows(driver, timer=None):
+    """Extract structured pending-transaction rows with one execute_script call
+
+    The timer's script_rows counts every row the script returned, including
+    rows dropped for having no player name.
+    """
+    rows = driver.execute_script(PENDING_ROWS_JS) or []
+    if timer:
+        timer.count('script_rows', len(rows))
+    named = [with_numbers(row) for row in rows if row.get('player_name')]
+    debug_logger().debug("script: %d rows, %d dropped with no player name", len(rows), len(rows) - len(named))
+    return named
+
+def fill_bids(driver, rows):
+    """Read the bid inputs page_source can't show (Angular sets them as properties)"""
+    if not rows or all(row.get('bid') is not None for row in rows):
+        return rows
+    bids = driver.execute_script(PENDING_BIDS_JS) or []
+    debug_logger().debug("source: %d bid inputs for %d rows", len(bids), len(rows))
+    if len(bids) == len(rows):
+        for row, bid in zip(rows, bids):
+            if row.get('bid') is None:
+                row['bid'] = to_int(bid)
+    return rows
+
+ROW_SELECTOR = ".supertable--pending-transaction-table .supertable__row"
+
+def is_candidate_text(text):
+    """Long enough and mentions a position - may hold a bid"""
+    return len(text) > 20 and any(pos in text for pos in POSITION_CODES)
+
+def walk_elements_for_players(driver, timer=None, row_selector=ROW_SELECTOR):
+    """Fallback extraction from element text, parsing each bid exactly once
+
+    Prefers the innermost bid-row containers. If the row markup is not found
+    (or row_selector is None), walks every element but skips the elements
+    inside a text it already kept (see pending_lexer.outermost_texts).
+    """
+    timer = timer or PhaseTimer()
+    logger = debug_logger()
+    rows = driver.find_elements(BY_CSS, row_selector) if row_selector else []
+    if rows:
+        timer.count('elements_scanned', len(rows))
+        texts = [row.text for row in rows]
+    else:
+        elements = driver.find_elements(BY_CSS, "*")
+        parents = driver.execute_script(ELEMENT_PARENTS_JS) or []
+        if len(parents) != len(elements):
+            # The DOM changed between the two calls - read every element; bid_identity still dedupes
+            logger.debug("walk: %d parents for %d elements - not skipping descendants", len(parents), len(elements))
+            parents = [-1] * len(elements)
+        
+        def read_text(index):
+            timer.count('elements_scanned')
+            try:
+                return elements[index].text.strip()
+            except:
+                return None
+        
+        texts = outermost_texts(read_text, parents, is_candidate_text)
+        logger.debug("walk: no %s rows - %d outermost candidate texts from %d elements",
+                     row_selector, len(texts), len(elements))
+    
+    all_players = []
+    seen_bids = set()
+    with timer.phase('parse'):
+        for text in texts:
+            timer.count('texts_parsed')
+            for player in parse_pending_text(text):
+                key = bid_identity(player)
+                if key in seen_bids:
+                    timer.count('duplicates_dropped')
+                    logger.debug("walk: dropped duplicate bid %s", key)
+                    continue
+                seen_bids.add(key)
+                all_players.append(player)
+    
+    logger.debug("walk: %d players from %d texts", len(all_players), len(texts))
+    return all_players
+
+PENDING_PATH = "/fantasy/league/{league_id}/transactions/pending;teamId=ALL_TEAMS"
+
+def pending_url(league_id=LEAGUE_ID):
+    """Pending page URL on fantrax.com, or on the FANTRAX_BASE_URL stand-in"""
+    return base_url() + PENDING_PATH.format(league_id=league_id)
+
+def load_credentials():
+    """Fantrax credentials from the environment (GitHub Actions) or config.json"""
+    username = os.getenv('FANTRAX_USERNAME')
+    password = os.getenv('FANTRAX_PASSWORD')
+    
+    if not username or not password:
+        config = load_config() or {}
+        username = config.get('username')
+        password = config.get('password')
+        if not username or not password:
+            return None, None
+    
+    return username, password
+
+LOGIN_BUTTON = (BY_XPATH, "//button[contains(@class, 'mat-gradient')]")
+LOGIN_FIELD = (BY_NAME, "userOrEmail")
+PENDING_TABLE = (BY_CSS, ".supertable--pending-transaction-table")
+CLAIMS_HEADER = (BY_XPATH, "//h4[contains(., 'Free Agent Claims')]")
+NO_PENDING = (BY_XPATH, "//*[contains(text(), 'No pending')]")
+
+# Seconds each phase may take before we give up on it
+DEFAULT_TIMEOUTS = {
+    'home': 15,
+    'login_modal': 10,
+    'login_redirect': 15,
+    'pending_table': 20,
+    'xhr': 5,
+}
+
+def load_timeouts():
+    """Phase timeouts from config.json "timeouts" and FANTRAX_TIMEOUT_<PHASE> overrides
+
+    A value that is not a number is reported and the phase keeps its default.
+    """
+    timeouts = dict(DEFAULT_TIMEOUTS)
+    configured = (load_config() or {}).get('timeouts') or {}
+    for phase in timeouts:
+        env_name = f"FANTRAX_TIMEOUT_{phase.upper()}"
+        for source, value in (('config.json', configured.get(phase)), (env_name, os.getenv(env_name))):
+            if value is None or value == '':
+                continue
+            try:
+                timeouts[phase] = float(value)
+            except (TypeError, ValueError):
+                print(f"⚠ Ignoring {source} timeout {value!r} for {phase} - using {timeouts[phase]}s")
+    return timeouts
+
+def wait_for(driver, timer, timeouts, phase, condition, required=True):
+    """Wait for a condition inside a timed phase instead of sleeping a fixed time"""
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.support.ui import WebDriverWait
+    
+    with timer.phase(phase):
+        try:
+            return WebDriverWait(driver, timeouts[phase], poll_frequency=0.2).until(condition)
+        except TimeoutException:
+            if required:
+                raise TimeoutException(f"{phase} not ready after {timeouts[phase]}s")
+            print(f"⚠ {phase} not ready after {timeouts[phase]}s - continuing")
+            return None
+
+def login_with_form(driver, username, password, timer, timeouts):
+    """Full UI login through the home page modal"""
+    from selenium.webdriver.common.keys import Keys
+    from selenium.webdriver.support import expected_conditions as EC
+    
+    with timer.phase('navigate'):
+        driver.get(f"{base_url()}/home")
+    login_btn = wait_for(driver, timer, timeouts, 'home', EC.element_to_be_clickable(LOGIN_BUTTON))
+    driver.execute_script("arguments[0].click();", login_btn)
+    
+    user_field = wait_for(driver, timer, timeouts, 'login_modal', EC.visibility_of_element_located(LOGIN_FIELD))
+    pass_field = driver.find_element(BY_NAME, "password")
+    
+    user_field.send_keys(username)
+    pass_field.send_keys(password)
+    pass_field.send_keys(Keys.RETURN)
+    
+    # The modal closes once Fantrax accepts the credentials
+    wait_for(driver, timer, timeouts, 'login_redirect', EC.invisibility_of_element_located(LOGIN_FIELD))
+
+def load_pending_page(driver, pending_url, timer, timeouts):
+    """Open the pending page and wait until the claims (or an empty/login state) render"""
+    from selenium.webdriver.support import expected_conditions as EC
+    
+    with timer.phase('navigate'):
+        driver.get(pending_url)
+    wait_for(driver, timer, timeouts, 'pending_table',
+             EC.any_of(EC.presence_of_element_located(PENDING_TABLE),
+                       EC.presence_of_element_located(CLAIMS_HEADER),
+                       EC.presence_of_element_located(NO_PENDING),
+                       EC.presence_of_element_located(LOGIN_FIELD)),
+             required=False)
+
+def pending_page_loaded(driver):
+    """True when the pending page rendered for a logged-in user"""
+    if driver.find_elements(*LOGIN_FIELD):
+        return False
+    return bool(driver.find_elements(BY_XPATH, "//*[contains(text(), 'Pending Transactions')]"))
+
+class BrowserSession:
+    """One Chrome instance that stays logged in across polls"""
+    
+    def __init__(self, username, password, timer=None, cookie_cache=session_cache.COOKIE_CACHE):
+        self.username = username
+        self.password = password
+        self.cookie_cache = cookie_cache
+        self.timer = timer or PhaseTimer()
+        self.timeouts = load_timeouts()
+        self.driver = None
+        self.needs_login = True
+        self.last_page_fingerprint = None
+    
+    def start(self):
+        """Launch Chrome and install any cached login cookies"""
+        from fantrax_monitor.chrome_driver import create_driver
+        
+        with self.timer.phase('driver_setup'):
+            self.driver = create_driver(performance_log=extraction_mode() == 'xhr' or recorder.active() is not None)
+        
+        cookies = session_cache.load_cookies(self.cookie_cache)
+        if cookies:
+            session_cache.apply_to_driver(self.driver, cookies)
+        self.needs_login = not cookies
+    
+    def login(self):
+        """Log in through the form and cache the cookies for other sessions"""
+        if self.driver is None:
+            self.start()
+        login_with_form(self.driver, self.username, self.password, self.timer, self.timeouts)
+        recorder.record_driver(self.driver)
+        session_cache.save_cookies(self.driver.get_cookies(), self.cookie_cache)
+        self.needs_login = False
+    
+    def close(self):
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            except:
+                pass
+            self.driver = None
+    
+    def restart(self):
+        """Throw away a crashed or wedged browser and start a fresh one"""
+        self.close()
+        self.start()
+    
+    def poll(self, league_id=LEAGUE_ID):
+        """Load the pending page, logging in again only if the session was dropped
+
+        Returns (players, deadline). WebDriver errors propagate so the caller
+        can decide whether to restart the browser.
+        """
+        from fantrax_monitor.chrome_driver import page_load_bytes
+        
+        if self.driver is None:
+            self.start()
+        driver = self.driver
+        league_url = pending_url(league_id)
+        
+        # Go straight to the pending page while the session (or cache) is good
+        if not self.needs_login:
+            load_pending_page(driver, league_url, self.timer, self.timeouts)
+            if not pending_page_loaded(driver):
+                print("Session rejected - logging in")
+                self.needs_login = True
+        
+        if self.needs_login:
+            self.login()
+            load_pending_page(driver, league_url, self.timer, self.timeouts)
+        print(f"✓ Pending page loaded ({page_load_bytes(driver) / 1024:.0f} KB transferred)")
+        
+        with self.timer.phase('extract'):
+            # One page_source transfer serves the deadline and the offline row parse
+            page_source = driver.page_source
+            auction_deadline = find_deadline(page_source)
+            
+            # Nothing to parse if the pending section (text and bid inputs) is exactly as last time
+            page_text = driver.execute_script(PENDING_TEXT_JS)
+            self.last_page_fingerprint = snapshot_state.text_fingerprint(page_text) if page_text else None
+            cached = snapshot_state.cached_players(league_id, auction_deadline, self.last_page_fingerprint)
+            if cached is not None:
+                print("✓ Pending page unchanged since last run - skipping parse")
+                return cached, auction_deadline
+            
+            # Find players - the app's own JSON (xhr mode), the page_source snapshot or
+            # one script call, falling back to the element walk if the table layout is not recognised
+            logger = debug_logger()
+            logger.debug("extract: mode %s, %d characters of page_source, deadline %s",
+                         extraction_mode(), len(page_source), auction_deadline)
+            all_players = []
+            if extraction_mode() == 'xhr':
+                all_players, raw_deadline = capture_pending_players(driver, self.timeouts['xhr'],
+                                                                    recorder.log_reader(driver))
+                auction_deadline = find_deadline(raw_deadline) or auction_deadline
+                if not all_players:
+                    print("⚠ Pending-transactions XHR not captured - reading the page instead")
+            if not all_players and extraction_mode() in ('source', 'xhr'):
+                all_players = fill_bids(driver, parse_pending_html(page_source))
+                self.timer.count('source_bytes', len(page_source))
+                logger.debug("extract: page_source gave %d rows", len(all_players))
+            if not all_players and extraction_mode() in ('source', 'script', 'xhr'):
+                all_players = extract_pending_rows(driver, self.timer)
+                logger.debug("extract: script fallback gave %d rows", len(all_players))
+            if not all_players:
+                logger.debug("extract: falling back to the element walk")
+                all_players = walk_elements_for_players(driver, self.timer)
+        
+        recorder.record_driver(driver)
+        return all_players, auction_deadline
+
+def extraction_mode():
+    """FANTRAX_EXTRACTION: xhr (captured JSON), source (parse page_source, default), script (one JS call) or walk"""
+    return os.getenv('FANTRAX_EXTRACTION', 'source')
+
+def make_session(backend, username, password, timer=None, cookie_cache=session_cache.COOKIE_CACHE):
+    """A BrowserSession or fantrax_http.HttpSession; both offer start/login/poll/restart/close"""
+    if backend == 'http':
+        from fantrax_monitor.fantrax_http import HttpSession
+        return HttpSession(username, password, cookie_cache=cookie_cache)
+    return BrowserSession(username, password, timer, cookie_cache)
+
+def record_history(league_id, auction_deadline, all_players, change=None):
+    """Append this snapshot to bid_history.db; a failure here does not fail the run
+
+    Pass the SnapshotChange from snapshot_state.record_snapshot: an unchanged
+    snapshot is already in the history, so it is not appended again.
+    """
+    if change is not None and not change.changed:
+        return
+    try:
+        bid_history.record_bids(league_id, auction_deadline, all_players)
+    except Exception as e:
+        print(f"⚠ Could not update bid history: {e}")
+
+def fetch_auction_data(backend, username, password, league_id=LEAGUE_ID, timer=None):
+    """One fetch with a throwaway session; returns (players, deadline text, page fingerprint)"""
+    timer = timer or PhaseTimer()
+    if backend == 'http':
+        from fantrax_monitor.fantrax_http import fetch_pending_players
+        with timer.phase('http_fetch'):
+            all_players, raw_deadline = fetch_pending_players(username, password, league_id)
+        timer.count('players_found', len(all_players))
+        return all_players, find_deadline(raw_deadline), None
+    
+    session = BrowserSession(username, password, timer)
+    try:
+        all_players, auction_deadline = session.poll(league_id)
+    finally:
+        session.close()
+    timer.count('players_found', len(all_players))
+    return all_players, auction_deadline, session.last_page_fingerprint
+
+def get_auction_data(backend=None, league_id=LEAGUE_ID):
+    """Scrape pending auctions with the browser or HTTP backend and save them"""
+    backend = backend or os.getenv('FANTRAX_BACKEND', 'browser')
+    
+    username, password = load_credentials()
+    if not username or not password:
+        print("Error: No credentials found")
+        return []
+    
+    timer = PhaseTimer()
+    try:
+        all_players, auction_deadline, page_fingerprint = fetch_auction_data(backend, username, password,
+                                                                             league_id, timer)
+    except Exception as e:
+        print(f"Error: {e}")
+        dump_diagnostics(f"Run failed: {e}")
+        return []
+    if not all_players:
+        dump_diagnostics("No players found")
+    
+    change = snapshot_state.record_snapshot(league_id, auction_deadline, all_players, page_fingerprint)
+    record_history(league_id, auction_deadline, all_players, change)
+    if change.changed:
+        print_changes(change)
+    else:
+        print("✓ Pending bids unchanged since last run")
+    
+    with timer.phase('save'):
+        save_results(all_players, auction_deadline, change)
+    timer.report()
+    timer.write_report(backend=backend, league=league_id, players=len(all_players))
+    return all_players
@@ -0,0 +1,20 @@
+"""Small file helpers shared by the caches and state files"""
+import json
+import os
+
+def write_json_atomic(path, data, indent=2):
+    """Write JSON to a temp file and os.replace it over path, so readers never see half a file"""
+    # Imported here: tempfile is slow to import and the parsers only need the readers
+    import tempfile
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix='.tmp-', suffix='.json', dir=directory)
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f, indent=indent)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
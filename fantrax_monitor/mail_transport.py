@@ -0,0 +1,94 @@
+"""One authenticated SMTP connection shared by every message in a run.
+
+The STARTTLS + AUTH handshake costs more than sending a short alert, so
+MailTransport connects once, sends every message over the same connection
+and reconnects transparently if the server drops it (SMTPServerDisconnected).
+Per-message send latency is kept in .latencies and printed by report().
+
+For local testing point config.json at a stand-in server without TLS/AUTH:
+    python -m aiosmtpd -n -l localhost:1025
+    "smtp_server": "localhost", "smtp_port": 1025, "smtp_starttls": false, "sender_password": ""
+"""
+import smtplib
+import time
+
+class MailTransport:
+    """Lazily connected SMTP session; use as a context manager so it is always closed"""
+    
+    def __init__(self, host, port, username=None, password=None, starttls=True, timeout=30, timer=None):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.timeout = timeout
+        self.timer = timer
+        self.server = None
+        self.connect_seconds = 0.0
+        self.latencies = []
+    
+    def connect(self):
+        start = time.perf_counter()
+        server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            server.ehlo()
+            if self.starttls:
+                server.starttls()
+                server.ehlo()
+            if self.username and self.password:
+                server.login(self.username, self.password)
+        except Exception:
+            server.close()
+            raise
+        self.server = server
+        elapsed = time.perf_counter() - start
+        self.connect_seconds += elapsed
+        if self.timer:
+            self.timer.add_time('smtp_connect', elapsed)
+    
+    def send(self, msg, from_addr=None, to_addrs=None):
+        """Send one email.message.Message; returns the seconds it took"""
+        start = time.perf_counter()
+        if self.server is None:
+            self.connect()
+        try:
+            self.server.send_message(msg, from_addr, to_addrs)
+        except smtplib.SMTPServerDisconnected:
+            # Idle timeout or server-side close - one fresh connection, then give up
+            self.server = None
+            self.connect()
+            self.server.send_message(msg, from_addr, to_addrs)
+        elapsed = time.perf_counter() - start
+        self.latencies.append((msg['Subject'], elapsed))
+        if self.timer:
+            self.timer.add_time('smtp_send', elapsed)
+            self.timer.count('emails_sent')
+        return elapsed
+    
+    def close(self):
+        if self.server is not None:
+            try:
+                self.server.quit()
+            except smtplib.SMTPException:
+                self.server.close()
+            self.server = None
+    
+    def report(self):
+        """Print connection time and one line per message sent"""
+        if not self.latencies:
+            return
+        print(f"SMTP connect/auth: {self.connect_seconds:.2f}s")
+        for subject, seconds in self.latencies:
+            print(f"  {seconds:6.2f}s  {subject}")
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+def transport_from_config(config, timer=None):
+    """MailTransport for the smtp_* / sender_* fields of config.json"""
+    return MailTransport(config['smtp_server'], int(config['smtp_port']),
+                         config.get('sender_email'), config.get('sender_password'),
+                         starttls=config.get('smtp_starttls', True), timer=timer)
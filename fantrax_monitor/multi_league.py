@@ -0,0 +1,158 @@
+"""Monitor several leagues in one run.
+
+Leagues come from config.json (or FANTRAX_LEAGUES=id1,id2 to override):
+
+    "leagues": ["vqsvwdkem1uv2c8b", {"id": "abc123", "name": "Dynasty",
+                                     "username": "other@example.com", "password": "..."}],
+    "max_workers": 4
+
+Each account logs in once, then every league's pending page is fetched
+concurrently in its own browser/HTTP session (bounded by max_workers), so
+a run takes about as long as the slowest league. Writes
+auction_players_<league>.json / email_summary_<league>.txt per league and the
+combined auction_players.json / email_summary.txt that Email_results.py sends.
+
+    python fantrax_scraper.py --all-leagues [--backend http]
+"""
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from fantrax_monitor import session_cache, snapshot_state
+from fantrax_monitor.fetch import load_credentials, make_session, record_history
+from fantrax_monitor.parse import find_deadline
+from fantrax_monitor.render import build_summary, print_changes, save_results
+from fantrax_monitor.settings import LEAGUE_ID, load_config
+from fantrax_monitor.timing import PhaseTimer
+
+DEFAULT_MAX_WORKERS = 4
+
+def load_leagues(config=None):
+    """League dicts (id, name, username, password, cookie_cache) to monitor"""
+    config = (load_config() or {}) if config is None else config
+    username, password = load_credentials()
+    
+    env_leagues = os.getenv('FANTRAX_LEAGUES')
+    entries = env_leagues.split(',') if env_leagues else config.get('leagues') or [LEAGUE_ID]
+    
+    leagues = []
+    for entry in entries:
+        if isinstance(entry, str):
+            entry = {'id': entry.strip()}
+        if not entry.get('id'):
+            continue
+        league_username = entry.get('username') or username
+        leagues.append({
+            'id': entry['id'],
+            'name': entry.get('name') or entry['id'],
+            'username': league_username,
+            'password': entry.get('password') or password,
+            'cookie_cache': session_cache.account_cache_path(league_username, username),
+        })
+    return leagues
+
+def load_max_workers(config=None):
+    config = (load_config() or {}) if config is None else config
+    try:
+        return max(1, int(os.getenv('FANTRAX_MAX_WORKERS') or config.get('max_workers') or DEFAULT_MAX_WORKERS))
+    except ValueError:
+        return DEFAULT_MAX_WORKERS
+
+def login_account(backend, league):
+    """Log one account in unless its cookie cache is already usable"""
+    if session_cache.load_cookies(league['cookie_cache']):
+        return
+    session = make_session(backend, league['username'], league['password'], cookie_cache=league['cookie_cache'])
+    try:
+        session.login()
+    finally:
+        session.close()
+
+def fetch_league(backend, league):
+    """Poll one league in its own session; never raises so one bad league can't sink the run"""
+    timer = PhaseTimer()
+    session = make_session(backend, league['username'], league['password'], timer, league['cookie_cache'])
+    start = time.perf_counter()
+    result = {'league': league, 'players': [], 'deadline': None, 'page_fingerprint': None, 'error': None}
+    try:
+        players, raw_deadline = session.poll(league['id'])
+        result['players'] = players
+        result['deadline'] = find_deadline(raw_deadline)
+        result['page_fingerprint'] = getattr(session, 'last_page_fingerprint', None)
+    except Exception as e:
+        result['error'] = str(e)
+    finally:
+        session.close()
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+def combined_summary(results):
+    """One email body with a section per league that has claims"""
+    sections = []
+    for result in results:
+        league = result['league']
+        if result['error']:
+            sections.append(f"=== {league['name']} ===\n⚠ Could not fetch pending claims: {result['error']}\n")
+        elif result['players']:
+            sections.append(f"=== {league['name']} ===\n" + build_summary(result['players'], result['deadline'], result['change']))
+    
+    total = sum(len(result['players']) for result in results)
+    header = f"Fantasy Baseball Auction Alert - {len(results)} leagues\n\nFound {total} player(s) being added across all leagues\n\n"
+    return header + '\n'.join(sections)
+
+def run_leagues(backend=None, leagues=None, max_workers=None):
+    """Fetch every league concurrently and write per-league and combined results"""
+    backend = backend or os.getenv('FANTRAX_BACKEND', 'browser')
+    config = load_config() or {}
+    leagues = leagues if leagues is not None else load_leagues(config)
+    max_workers = max_workers or load_max_workers(config)
+    if not leagues or not all(league['username'] and league['password'] for league in leagues):
+        print("Error: No credentials found")
+        return []
+    
+    print(f"=== Fantrax Auction Monitor: {len(leagues)} leagues ({backend}, {max_workers} workers) ===")
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        # One login per account, then every league shares its cookies
+        accounts = {}
+        for league in leagues:
+            accounts.setdefault(league['cookie_cache'], league)
+        for future in [pool.submit(login_account, backend, league) for league in accounts.values()]:
+            try:
+                future.result()
+            except Exception as e:
+                # Leave it to the league sessions to log in themselves
+                print(f"⚠ Login failed ({e})")
+        
+        results = list(pool.map(lambda league: fetch_league(backend, league), leagues))
+    elapsed = time.perf_counter() - start
+    
+    combined_players = []
+    for result in results:
+        league = result['league']
+        print(f"\n--- {league['name']} ({result['seconds']:.2f}s) ---")
+        if result['error']:
+            print(f"❌ {result['error']}")
+            result['change'] = None
+            continue
+        result['change'] = snapshot_state.record_snapshot(league['id'], result['deadline'], result['players'],
+                                                          result['page_fingerprint'])
+        record_history(league['id'], result['deadline'], result['players'], result['change'])
+        print_changes(result['change'])
+        save_results(result['players'], result['deadline'], result['change'], suffix=f"_{league['id']}")
+        combined_players += [dict(player, league=league['name']) for player in result['players']]
+    
+    with open('auction_players.json', 'w') as f:
+        json.dump(combined_players, f, indent=2)
+    if combined_players:
+        with open('email_summary.txt', 'w', encoding='utf-8') as f:
+            f.write(combined_summary(results))
+    
+    # Recorded last so Email_results' already_emailed() sees every league's bids
+    snapshot_state.record_snapshot('+'.join(league['id'] for league in leagues), None, combined_players)
+    
+    slowest = max((result['seconds'] for result in results), default=0.0)
+    print(f"\n✓ {len(combined_players)} players across {len(leagues)} leagues in {elapsed:.2f}s "
+          f"(slowest league {slowest:.2f}s)")
+    return results
@@ -0,0 +1,318 @@
+"""Notifiers: the alert email (subject, body, recipients) and its SMTP delivery."""
+import smtplib
+import json
+import os
+import re
+from email.mime.text import MIMEText
+from email.mime.multipart import MIMEMultipart
+from datetime import datetime
+from fantrax_monitor import snapshot_state
+from fantrax_monitor.mail_transport import transport_from_config
+from fantrax_monitor.settings import load_config
+from fantrax_monitor.subscriptions import index_from_config, unlisted_email_to
+
+def load_email_config():
+    """Load email configuration from config.json file"""
+    config = load_config()
+    if config is None:
+        print("config.json not found (or not valid JSON).")
+        return None
+    
+    # Check required email fields
+    required_fields = ['smtp_server', 'smtp_port', 'sender_email', 'sender_password', 'email_to', 'email_subject']
+    if config.get('subscribers'):
+        # Per-subscriber alerts (see subscriptions.py) don't need a shared recipient list
+        required_fields.remove('email_to')
+    missing_fields = [field for field in required_fields if field not in config]
+    
+    if missing_fields:
+        print(f"Missing email configuration fields in config.json: {missing_fields}")
+        print("\nPlease add these email fields to your config.json:")
+        print('  "smtp_server": "smtp.gmail.com",')
+        print('  "smtp_port": 587,')
+        print('  "sender_email": "your_email@gmail.com",')
+        print('  "sender_password": "your_app_password",')
+        print('  "email_to": "recipient@gmail.com",')
+        print('  "email_cc": "optional_cc@gmail.com",')
+        print('  "email_subject": "Current Fantrax Auctions - Will Process at "')
+        return None
+    
+    # Debug: show what email_subject was loaded
+    print(f"✓ Using email subject: '{config['email_subject']}'")
+    
+    return config
+
+def send_auction_email(force=False, transport=None):
+    """Send email with auction summary (over transport if given, so callers can share one connection)"""
+    
+    # Load email configuration
+    config = load_email_config()
+    if not config:
+        return False
+    
+    # Don't re-send the same pending bids (see snapshot_state.py)
+    if not force and snapshot_state.already_emailed():
+        print("✓ Pending bids unchanged since the last email - not sending")
+        return True
+    
+    # Check if auction_players.json exists and has data
+    auction_data = None
+    has_players = False
+    
+    if os.path.exists('auction_players.json'):
+        try:
+            # Read the file content first to check if it's empty
+            with open('auction_players.json', 'r') as f:
+                file_content = f.read().strip()
+            
+            # If file is completely empty or just whitespace
+            if not file_content:
+                print("✓ Found auction_players.json but it's empty (blank file)")
+                has_players = False
+            else:
+                # Try to parse JSON
+                auction_data = json.loads(file_content)
+                
+                # Check if there are any players in the data
+                if isinstance(auction_data, list):
+                    has_players = len(auction_data) > 0
+                    print(f"✓ Found auction_players.json with {len(auction_data)} records")
+                elif isinstance(auction_data, dict):
+                    # If it's a dict, check if it has any meaningful data
+                    has_players = len(auction_data) > 0 and any(auction_data.values())
+                    print(f"✓ Found auction_players.json with dict data: {bool(has_players)}")
+                else:
+                    print(f"✓ Found auction_players.json with unexpected format: {type(auction_data)}")
+                    has_players = False
+        
+        except json.JSONDecodeError as e:
+            print(f"❌ auction_players.json contains invalid JSON: {e}")
+            print("Treating as 'no players' scenario")
+            has_players = False
+        except Exception as e:
+            print(f"❌ Error reading auction_players.json: {e}")
+            return False
+    else:
+        print("❌ auction_players.json not found")
+        return False
+    
+    # Determine email content based on whether there are players
+    if has_players:
+        # Check if email summary file exists for players
+        if not os.path.exists('email_summary.txt'):
+            print("❌ email_summary.txt not found. Run the auction scraper first.")
+            return False
+        
+        # Read email content
+        try:
+            with open('email_summary.txt', 'r') as f:
+                email_body = f.read()
+            print(f"✓ Read email_summary.txt - {len(email_body)} characters")
+        except Exception as e:
+            print(f"❌ Error reading email_summary.txt: {e}")
+            return False
+        
+        # Double-check that the email body actually contains player data
+        if "Found 0 player(s)" in email_body or len(email_body.strip()) < 50:
+            has_players = False
+    
+    # If no players, create a simple "no players" email
+    if not has_players:
+        email_body = no_players_body()
+        print("✓ No players found - sending 'no players' notification")
+    
+    # The deadline line is the only structured data left in the text
+    deadline_text = None
+    auction_deadline = None
+    deadline_match = re.search(r'Auction Deadline: (.+)', email_body)
+    if deadline_match:
+        from fantrax_monitor.parse import parse_deadline
+        deadline_text = deadline_match.group(1).strip()
+        auction_deadline = parse_deadline(deadline_text)
+    
+    # With subscribers, each one (email_to included) gets the bids its filters match
+    index = index_from_config(config)
+    if index is not None:
+        from fantrax_monitor.pipeline import send_to_subscribers
+        from fantrax_monitor.timing import PhaseTimer
+        players = auction_data if has_players and isinstance(auction_data, list) else []
+        return send_to_subscribers(config, index, players, deadline_text, 'digest', None, transport, PhaseTimer(),
+                                   deadline=auction_deadline)
+    
+    return send_summary(config, email_body, auction_deadline, has_players, transport)
+
+def deadline_subject(deadline):
+    """datetime -> '2am on June 12th' ('2:30am' when not on the hour)"""
+    hour = deadline.hour % 12 or 12
+    clock = f"{hour}{f':{deadline.minute:02d}' if deadline.minute else ''}{'am' if deadline.hour < 12 else 'pm'}"
+    
+    # Add ordinal suffix to day
+    day = deadline.day
+    if day in [11, 12, 13]:
+        ordinal = "th"
+    elif day % 10 == 1:
+        ordinal = "st"
+    elif day % 10 == 2:
+        ordinal = "nd"
+    elif day % 10 == 3:
+        ordinal = "rd"
+    else:
+        ordinal = "th"
+    
+    return f"{clock} on {deadline.strftime('%B')} {day}{ordinal}"
+
+def build_subject(config, has_players, deadline=None):
+    """Subject line from the configured prefix and the claim deadline (a datetime)"""
+    if not has_players:
+        return "Fantrax Auctions - No Active Bidding"
+    if deadline:
+        return f"{config['email_subject']}{deadline_subject(deadline)}"
+    # No deadline found, just use the base subject
+    return config['email_subject'].rstrip()
+
+def digest_hours(config):
+    """Hours between full-list digests (FANTRAX_DIGEST_HOURS or config "digest_hours"); None = once per claim period"""
+    value = os.getenv('FANTRAX_DIGEST_HOURS') or (config or {}).get('digest_hours')
+    try:
+        return float(value) if value else None
+    except (TypeError, ValueError):
+        return None
+
+def no_players_body():
+    return f"""No players currently being bid on.
+
+The Fantrax auction monitor checked for pending auctions but found no active bidding at this time.
+
+Last checked: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+
+You will receive another alert when new auctions become available.
+"""
+
+def send_summary(config, email_body, auction_deadline=None, has_players=True, transport=None, timer=None,
+                 digest=True, to=None, mark=True):
+    """Send an already-rendered summary; auction_deadline is a datetime (or None)
+
+    digest=False marks a delta-only alert, so the next full digest stays due.
+    to sends to one subscriber instead of email_to (email_cc is only copied on
+    the message to subscriptions.unlisted_email_to); mark=False leaves the snapshot unmarked so the
+    caller can mark it once every message is out.
+    """
+    email_subject = build_subject(config, has_players, auction_deadline)
+    
+    try:
+        # Create email message
+        msg = MIMEMultipart()
+        msg['From'] = config['sender_email']
+        # Use email addresses exactly as specified in config
+        msg['To'] = to or config['email_to']
+        to_email_to = to is None or to == unlisted_email_to(config)
+        
+        # For SMTP sending, we need individual email addresses in a list
+        # Split semicolon-separated addresses for the actual sending
+        to_recipients = [email.strip() for email in msg['To'].split(';')]
+        recipients = to_recipients.copy()
+        
+        # Add CC if specified
+        if to_email_to and 'email_cc' in config and config['email_cc']:
+            msg['Cc'] = config['email_cc']
+            cc_recipients = [email.strip() for email in config['email_cc'].split(';')]
+            recipients.extend(cc_recipients)
+        
+        msg['Subject'] = email_subject
+        
+        # Add body to email (NO ATTACHMENTS)
+        msg.attach(MIMEText(email_body, 'plain'))
+        
+        # Connect to server (once per run) and send email
+        print(f"Sending email via {config['smtp_server']}...")
+        print(f"To: {msg['To']}")
+        if msg['Cc']:
+            print(f"CC: {config['email_cc']}")
+        print(f"Subject: {email_subject}")
+        
+        own_transport = transport is None
+        transport = transport or transport_from_config(config, timer)
+        try:
+            seconds = transport.send(msg, config['sender_email'], recipients)
+        finally:
+            if own_transport:
+                transport.close()
+        
+        print(f"✅ Email sent successfully! ({seconds:.2f}s)")
+        
+        # Log the sent email
+        log_entry = f"{datetime.now().isoformat()}: Email sent to {', '.join(recipients)}"
+        log_entry += f" - Subject: {email_subject}\n"
+        
+        with open('email_log.txt', 'a') as f:
+            f.write(log_entry)
+        
+        if mark:
+            snapshot_state.mark_emailed(digest)
+        return True
+    
+    except smtplib.SMTPAuthenticationError:
+        print("❌ Email authentication failed!")
+        print("For Gmail:")
+        print("1. Make sure 2-factor authentication is enabled")
+        print("2. Use an 'App Password' (not your regular password)")
+        print("3. Check that the sender_email and sender_password in config.json are correct")
+        return False
+    
+    except smtplib.SMTPConnectError:
+        print("❌ Could not connect to email server!")
+        print("Check your internet connection and SMTP server settings.")
+        return False
+    
+    except Exception as e:
+        print(f"❌ Error sending email: {e}")
+        return False
+
+def test_email_config():
+    """Test email configuration without sending auction data"""
+    config = load_email_config()
+    if not config:
+        return False
+    
+    try:
+        # Create test message
+        msg = MIMEMultipart()
+        msg['From'] = config['sender_email']
+        # Everyone who can get alerts: email_to and/or the subscribers
+        index = index_from_config(config)
+        msg['To'] = '; '.join(index.emails) if index is not None else config['email_to']
+        recipients = [email.strip() for email in msg['To'].split(';')]
+        
+        # Add CC if specified
+        if 'email_cc' in config and config['email_cc']:
+            msg['Cc'] = config['email_cc']
+            recipients.extend(email.strip() for email in config['email_cc'].split(';'))
+        
+        msg['Subject'] = "Fantrax Auction Monitor - Test Email"
+        
+        test_body = f"""This is a test email from your Fantrax Auction Monitor.
+
+If you receive this email, your configuration is working correctly!
+
+Test sent at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+
+You should receive auction alerts at this email address when players are found.
+"""
+
+        msg.attach(MIMEText(test_body, 'plain'))
+        
+        # Send test email
+        print(f"Sending test email to {msg['To']}")
+        if 'email_cc' in config and config['email_cc']:
+            print(f"CC: {config['email_cc']}")
+        
+        with transport_from_config(config) as transport:
+            transport.send(msg, config['sender_email'], recipients)
+            transport.report()
+        
+        print("✅ Test email sent successfully!")
+        return True
+    
+    except Exception as e:
+        print(f"❌ Test email failed: {e}")
+        return False
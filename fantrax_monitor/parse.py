@@ -0,0 +1,278 @@
+"""Parsers: pending-page text and JSON -> player dicts, and the claim deadline.
+
+Everything here is pure string work - no selenium, webdriver-manager or
+requests - so tests, benchmarks and the HTTP backend can import it without
+paying for the browser stack (python -m benchmarks.imports measures it).
+The page_source and element-text parsers themselves live in pending_html
+and pending_lexer; find_players_being_added and parse_auction_data are the
+older line-window parsers, kept only as benchmark baselines (no fetch path
+calls them - they miss bids and two-letter clubs). Priority, bid and claim
+budget come from pending_html, pending_lexer and parse_pending_transactions,
+all as ints (pending_lexer.with_numbers).
+
+parse_pending_transactions reads a getPendingTransactions field layout that
+has not been checked against a real capture of the API (the fixtures are
+hand-written), so it raises PendingPayloadError rather than returning no
+claims when the payload does not look like that layout.
+"""
+import re
+from datetime import datetime, timedelta, timezone
+from fantrax_monitor.pending_lexer import LINE_PATTERN, POSITION, POSITIONS, TEAM, TEXT, debug_logger, with_numbers
+
+_central = None
+
+def central():
+    """Fantrax's Central time zone, loaded on first use (the tz database is slow to import)"""
+    global _central
+    if _central is None:
+        try:
+            from zoneinfo import ZoneInfo
+            _central = ZoneInfo('America/Chicago')
+        except Exception:
+            # No tz database (e.g. Windows without tzdata) - CDT is close enough
+            _central = timezone(timedelta(hours=-5))
+    return _central
+
+def line_kind(line):
+    """pending_lexer token kind of one line (TEXT when nothing else matches)"""
+    match = LINE_PATTERN.fullmatch(line.strip())
+    return match.lastgroup if match else TEXT
+
+def player_name_at(lines, index):
+    """lines[index] if it heads a player block (a position list, then a '- TEAM' line), else None"""
+    if index < 0 or index + 2 >= len(lines):
+        return None
+    line = lines[index].strip()
+    if (line and line_kind(line) == TEXT and line_kind(lines[index + 1]) == POSITIONS
+            and line_kind(lines[index + 2]) == TEAM):
+        return line
+    return None
+
+POSITION_WORD = re.compile(rf'\b{POSITION}\b')
+
+def find_players_being_added(text):
+    """Find players being added using position-based logic"""
+    lines = text.split('\n')
+    players = []
+    
+    for line_num, line in enumerate(lines):
+        line = line.strip()
+        
+        # Check if line is a position
+        is_position = line_kind(line) == POSITIONS
+        
+        if is_position:
+            # Look for player name before position - the nearest line that heads a player block
+            player_name = None
+            for i in range(line_num - 1, max(0, line_num - 3) - 1, -1):
+                player_name = player_name_at(lines, i)
+                if player_name:
+                    break
+            
+            # Check for bid keywords near this player
+            if player_name:
+                # Use a much smaller, more precise context window
+                context_start = max(0, line_num - 2)
+                context_end = min(len(lines), line_num + 4)
+                context_lines = lines[context_start:context_end]
+                
+                # Look for bid keywords only in the immediate vicinity
+                has_bid = False
+                for context_line in context_lines:
+                    if any(keyword in context_line for keyword in ['BID', 'SUBMITTED', 'PTY']):
+                        has_bid = True
+                        break
+                
+                debug_logger().debug("%s - Context lines: %s - Has bid: %s", player_name, context_lines, has_bid)
+                
+                if has_bid:
+                    # Find team
+                    team = None
+                    for i in range(line_num+1, min(len(lines), line_num+5)):
+                        if re.match(r'^-\s*[A-Z]{3}$', lines[i].strip()):
+                            team = lines[i].strip().replace('-', '').strip()
+                            break
+                    
+                    players.append({
+                        'player_name': player_name,
+                        'position': line,
+                        'team': team
+                    })
+    
+    return players
+
+def parse_auction_data(raw_text):
+    """Parse one element's auction text into a single claim dict (the old Web_scrape.py parser)"""
+    lines = [line.strip() for line in raw_text.split('\n') if line.strip()]
+    data = {}
+    
+    # Find all player names first
+    all_player_names = []
+    for i, line in enumerate(lines):
+        name = player_name_at(lines, i)
+        if name:
+            all_player_names.append((i, name))
+    
+    if not all_player_names:
+        return data  # No valid player name found
+    
+    # First player is the one being claimed
+    data['player_name'] = all_player_names[0][1]
+    claim_index = all_player_names[0][0]
+    # Only look at next 8 lines to avoid other players' data
+    relevant_lines = lines[all_player_names[0][0]:all_player_names[0][0]+8]
+    
+    # Extract position, team, and time from relevant lines only
+    positions = []
+    for offset, line in enumerate(relevant_lines):
+        if line != data['player_name'] and player_name_at(lines, claim_index + offset):
+            break  # Stop at next player name
+        
+        # Find positions
+        positions.extend(POSITION_WORD.findall(line))
+        
+        # Find team (3-letter code, excluding common words)
+        if 'team' not in data:
+            teams = re.findall(r'\b([A-Z]{3})\b', line)
+            for team in teams:
+                if team not in {'BID', 'PTY', 'POS', 'STA', 'DEL', 'CDT'}:
+                    data['team'] = team
+                    break
+        
+        # Find bid time
+        if 'bid_time' not in data:
+            time_match = re.search(r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d+,?\s+\d+:\d+\s+(AM|PM)', line)
+            if time_match:
+                data['bid_time'] = time_match.group(0)
+    
+    # Set positions - combine all unique positions into single field
+    if positions:
+        unique_pos = list(set(positions))
+        if len(unique_pos) > 1:
+            data['position'] = '/'.join(unique_pos)
+        else:
+            data['position'] = positions[0]
+    
+    # If there are multiple players, need to determine which is claim vs drop
+    if len(all_player_names) > 1:
+        # Look for bid/transaction keywords to identify the claimed player
+        first_player_idx = all_player_names[0][0]
+        second_player_idx = all_player_names[1][0]
+        
+        # Check if first player has bid context (BID, PTY, SUBMITTED)
+        first_has_bid = False
+        for i in range(first_player_idx, min(first_player_idx + 8, len(lines))):
+            if any(keyword in lines[i] for keyword in ['BID', 'PTY', 'SUBMITTED']):
+                first_has_bid = True
+                break
+        
+        # Check if second player has bid context  
+        second_has_bid = False
+        for i in range(second_player_idx, min(second_player_idx + 8, len(lines))):
+            if any(keyword in lines[i] for keyword in ['BID', 'PTY', 'SUBMITTED']):
+                second_has_bid = True
+                break
+        
+        # If only first player has bid context, second is drop
+        if first_has_bid and not second_has_bid:
+            data['drop_player'] = all_player_names[1][1]
+        # If only second player has bid context, first is drop (swap them)
+        elif second_has_bid and not first_has_bid:
+            data['player_name'] = all_player_names[1][1]
+            data['drop_player'] = all_player_names[0][1]
+            # Re-extract details for the actual claimed player
+            claim_index = all_player_names[1][0]
+            relevant_lines = lines[claim_index:claim_index+8]
+            data = {'player_name': all_player_names[1][1]}
+            positions = []
+            for offset, line in enumerate(relevant_lines):
+                if line != data['player_name'] and player_name_at(lines, claim_index + offset):
+                    break
+                positions.extend(POSITION_WORD.findall(line))
+                if 'team' not in data:
+                    teams = re.findall(r'\b([A-Z]{3})\b', line)
+                    for team in teams:
+                        if team not in {'BID', 'PTY', 'POS', 'STA', 'DEL', 'CDT'}:
+                            data['team'] = team
+                            break
+                if 'bid_time' not in data:
+                    time_match = re.search(r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d+,?\s+\d+:\d+\s+(AM|PM)', line)
+                    if time_match:
+                        data['bid_time'] = time_match.group(0)
+            if positions:
+                unique_pos = list(set(positions))
+                if len(unique_pos) > 1:
+                    data['position'] = '/'.join(unique_pos)
+                else:
+                    data['position'] = positions[0]
+            data['drop_player'] = all_player_names[0][1]
+    
+    return data
+
+class PendingPayloadError(ValueError):
+    """A getPendingTransactions payload without the fields parse_pending_transactions reads"""
+
+def parse_pending_transactions(data):
+    """Turn a getPendingTransactions payload into player dicts (same keys as the scrapers)
+
+    With teamId=ALL_TEAMS the payload already holds every team's claims and
+    claim budget, so one request covers the whole league; priority, bid and
+    claim budget come back as ints like the scrapers' rows. A payload with no
+    'teams' list, or a transaction with no claimed player, raises
+    PendingPayloadError: the layout is unverified, and reading it as "no
+    claims" would send an empty alert.
+    """
+    logger = debug_logger()
+    if not isinstance(data, dict) or not isinstance(data.get('teams'), list):
+        keys = sorted(data) if isinstance(data, dict) else type(data).__name__
+        raise PendingPayloadError(f"no 'teams' list in the pending payload (got {keys})")
+    deadline = data.get('deadline')
+    players = []
+    
+    for team in data['teams']:
+        for transaction in team.get('transactions') or []:
+            claim = transaction.get('claimScorer')
+            drop = transaction.get('dropScorer') or {}
+            if not isinstance(claim, dict) or not claim.get('name'):
+                raise PendingPayloadError(f"{team.get('teamName')} transaction has no claimScorer name "
+                                          f"(keys {sorted(transaction)})")
+            logger.debug("json: %s claims %s (bid %s)", team.get('teamName'), claim['name'], transaction.get('bid'))
+            players.append(with_numbers({
+                'player_name': claim['name'],
+                'position': claim.get('posShortNames'),
+                'team': claim.get('teamShortName'),
+                'priority': transaction.get('priority'),
+                'bid': transaction.get('bid'),
+                'bid_time': transaction.get('submittedDate'),
+                'drop_player': drop.get('name'),
+                'deadline': deadline,
+                'claim_budget': team.get('claimBudget'),
+                'fantasy_team': team.get('teamName'),
+            }))
+    
+    logger.debug("json: %d claims from %d teams", len(players), len(data['teams']))
+    return players
+
+DEADLINE_PATTERN = re.compile(r'(Mon|Tue|Wed|Thu|Fri|Sat|Sun)\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d+,?\s+\d+:\d+\s+(AM|PM)')
+
+def find_deadline(text):
+    """Return the first 'Thu Jun 12, 2:00 AM' style deadline in text, or None"""
+    deadline_match = DEADLINE_PATTERN.search(text or '')
+    return deadline_match.group(0) if deadline_match else None
+
+def parse_deadline(deadline, now=None):
+    """'Thu Jun 12, 2:00 AM' (Fantrax shows Central time, no year) -> aware datetime"""
+    if not deadline:
+        return None
+    match = re.search(r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d+),?\s+(\d+):(\d+)\s+(AM|PM)', deadline)
+    if not match:
+        return None
+    
+    now = now or datetime.now(central())
+    month = datetime.strptime(match.group(1), '%b').month
+    hour = int(match.group(3)) % 12 + (12 if match.group(5) == 'PM' else 0)
+    parsed = datetime(now.year, month, int(match.group(2)), hour, int(match.group(4)), tzinfo=central())
+    # A deadline shown in early January while it is still December
+    if (now - parsed).days > 180:
+        parsed = parsed.replace(year=now.year + 1)
+    return parsed
@@ -0,0 +1,202 @@
+"""Pending-transaction rows from one driver.page_source snapshot, parsed offline.
+
+page_source.html is ~180 KB, most of it inline <style> blocks and
+navigation. parse_pending_html() slices out each <pending-transactions-table>
+section with a plain string search and streams only those slices through
+PendingTableParser, so the styles are never tokenised and the rows cost one
+WebDriver transfer instead of a call per element. It returns the same row
+dicts as fantrax_monitor.fetch.extract_pending_rows (PENDING_ROWS_JS).
+
+Angular sets the bid <input> value as a property, not an attribute, so a
+page_source snapshot usually has no bids; see fantrax_monitor.fetch.fill_bids.
+
+    python -m fantrax_monitor.pending_html [page_source.html]
+"""
+from html.parser import HTMLParser
+
+from fantrax_monitor.pending_lexer import debug_logger, with_numbers
+
+SECTION_TAG = 'pending-transactions-table'
+SECTION_OPEN = f'<{SECTION_TAG}'
+SECTION_CLOSE = f'</{SECTION_TAG}>'
+VOID_TAGS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track', 'wbr'}
+SKIPPED_TAGS = {'style', 'script', 'svg', 'template'}
+CHUNK_SIZE = 64 * 1024
+
+# Class -> role of the element inside a section; roles drive where text goes
+CLASS_ROLES = {
+    'sub-heading': 'sub_heading',
+    'single-header--sub-header': 'budget',
+    'supertable--pending-transaction-table': 'table',
+    'supertable__row': 'row',
+    'supertable__cell': 'cell',
+    'supertable__cell__head': 'head',
+    'supertable__cell--ptt--75-mobile': 'drop_cell',
+    'scorer__info__name': 'name',
+    'scorer__info__positions': 'positions',
+}
+
+class PendingTableParser(HTMLParser):
+    """Incremental parser for <pending-transactions-table> markup; feed() it in any chunks"""
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.rows = []
+        self.logger = debug_logger()
+        self.stack = []       # (tag, own roles, roles including ancestors') inside a section
+        self.skipped = 0      # open <style>/<script>/<svg> elements
+        self.deadline = None
+        self.budget = None
+        self.row = None
+        self.cell = None
+    
+    def roles(self):
+        return self.stack[-1][2] if self.stack else frozenset()
+    
+    def handle_starttag(self, tag, attrs):
+        if tag == SECTION_TAG:
+            self.stack = [(tag, {'section'}, frozenset({'section'}))]
+            self.deadline = None
+            self.budget = None
+            return
+        if not self.stack or tag in VOID_TAGS and tag != 'input':
+            return
+        if tag in SKIPPED_TAGS:
+            self.skipped += 1
+        
+        classes = ''
+        value = None
+        for name, attr_value in attrs:
+            # Only class (and an input's value) matter; style and the rest are skipped
+            if name == 'class':
+                classes = attr_value or ''
+            elif name == 'value':
+                value = attr_value
+        roles = {CLASS_ROLES[name] for name in classes.split() if name in CLASS_ROLES}
+        open_roles = self.roles()
+        
+        if tag == 'input':
+            if self.cell is not None and value is not None:
+                self.cell['input'] = value
+            return
+        if tag == 'h5' and 'sub_heading' in open_roles and self.deadline is None:
+            roles.add('deadline')
+            self.deadline = ''
+        if tag == 'b' and 'budget' in open_roles and self.budget is None:
+            roles.add('budget_amount')
+            self.budget = ''
+        if 'row' in roles and 'table' in open_roles:
+            self.row = {'name': None, 'drop': None, 'spans': [], 'cells': {}}
+        if 'cell' in roles and self.row is not None:
+            self.cell = {'head': '', 'text': '', 'input': None}
+        if 'name' in roles and self.row is not None:
+            roles.add('drop_name' if 'drop_cell' in open_roles else 'claim_name')
+            self.row['current_name'] = ''
+        if tag == 'span' and 'positions' in open_roles and self.row is not None:
+            roles.add('span')
+            self.row['spans'].append('')
+        self.stack.append((tag, roles, open_roles | roles))
+    
+    def handle_endtag(self, tag):
+        # Close back to the matching open tag (tolerates unclosed children)
+        for depth in range(len(self.stack) - 1, -1, -1):
+            if self.stack[depth][0] == tag:
+                for open_tag, roles, _ in reversed(self.stack[depth:]):
+                    self.close_element(open_tag, roles)
+                del self.stack[depth:]
+                return
+    
+    def close_element(self, tag, roles):
+        if tag in SKIPPED_TAGS:
+            self.skipped -= 1
+        if 'deadline' in roles:
+            self.deadline = self.deadline.strip() or None
+        if 'budget_amount' in roles:
+            self.budget = self.budget.strip().lstrip('$') or None
+        if self.row is not None:
+            if 'claim_name' in roles and self.row['name'] is None:
+                self.row['name'] = self.row.pop('current_name').strip()
+            elif 'drop_name' in roles and self.row['drop'] is None:
+                self.row['drop'] = self.row.pop('current_name').strip()
+            if 'cell' in roles and self.cell is not None:
+                self.close_cell()
+            if 'row' in roles:
+                self.close_row()
+    
+    def close_cell(self):
+        cell, self.cell = self.cell, None
+        label = cell['head'].strip().upper()
+        if not label:
+            return
+        value = cell['input'] if cell['input'] is not None else cell['text']
+        self.row['cells']['SUBMITTED' if label.startswith('SUBMITTED') else label] = value.strip()
+    
+    def close_row(self):
+        row, self.row = self.row, None
+        if not row['name']:
+            self.logger.debug("html: dropped a row with no player name (cells %s)", row['cells'])
+            return
+        spans = [span.strip() for span in row['spans']]
+        cells = row['cells']
+        self.rows.append(with_numbers({
+            'player_name': row['name'],
+            'position': spans[0] if spans else None,
+            'team': spans[1].replace('-', '', 1).strip() if len(spans) > 1 else None,
+            'priority': cells.get('PTY') or None,
+            'bid': cells.get('BID') or None,
+            'bid_time': cells.get('SUBMITTED') or None,
+            'drop_player': row['drop'] or None,
+            'deadline': self.deadline,
+            'claim_budget': self.budget,
+        }))
+        self.logger.debug("html: claim %s (%s) - %s", row['name'], spans, cells)
+    
+    def handle_data(self, data):
+        if not self.stack or self.skipped:
+            return
+        roles = self.roles()
+        if 'deadline' in roles:
+            self.deadline += data
+        if 'budget_amount' in roles:
+            self.budget += data
+        if self.row is None:
+            return
+        if 'claim_name' in roles or 'drop_name' in roles:
+            self.row['current_name'] += data
+        if 'span' in roles:
+            self.row['spans'][-1] += data
+        if self.cell is not None:
+            self.cell['head' if 'head' in roles else 'text'] += data
+
+def pending_sections(page_source):
+    """Each <pending-transactions-table>...</...> slice of the page, in order"""
+    start = page_source.find(SECTION_OPEN)
+    while start != -1:
+        end = page_source.find(SECTION_CLOSE, start)
+        end = len(page_source) if end == -1 else end + len(SECTION_CLOSE)
+        yield page_source[start:end]
+        start = page_source.find(SECTION_OPEN, end)
+
+def parse_pending_html(page_source, chunk_size=CHUNK_SIZE):
+    """Row dicts for every claim in a page_source snapshot ([] if the table is not there)"""
+    parser = PendingTableParser()
+    for section in pending_sections(page_source or ''):
+        for offset in range(0, len(section), chunk_size):
+            parser.feed(section[offset:offset + chunk_size])
+    parser.close()
+    parser.logger.debug("html: %d claims from %d characters of page_source", len(parser.rows), len(page_source or ''))
+    return parser.rows
+
+def parse_pending_file(path, chunk_size=CHUNK_SIZE):
+    """parse_pending_html over a saved snapshot such as page_source.html"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return parse_pending_html(f.read(), chunk_size)
+
+if __name__ == "__main__":
+    import sys
+    rows = parse_pending_file(sys.argv[1] if len(sys.argv) > 1 else 'page_source.html')
+    print(f"Deadline: {rows[0]['deadline'] if rows else None}")
+    print(f"Found {len(rows)} players being added:")
+    for i, row in enumerate(rows, 1):
+        print(f"  {i}. {row['player_name']} ({row['position']}) - {row['team']} - PTY {row['priority']} - "
+              f"{row['bid_time']}" + (f" dropping {row['drop_player']}" if row['drop_player'] else ""))
@@ -0,0 +1,222 @@
+"""Single-pass tokenizer and state machine for pending-transaction text.
+
+The rendered pending page reads, one value per line:
+
+    Free Agent Claims / Thu Jun 12, 2:00 AM CDT / Claim Budget Remaining: / $31
+    Jo Adell / OF / - LAA / PTY / 1 / BID / 4 / SUBMITTED (CDT) / Jun 10, 2:24 PM
+    POS / OF / STA / Res / [drop player / positions / - TEAM]
+
+tokenize() classifies every line with one precompiled pattern and
+parse_pending_text() walks the tokens once, so the cost is linear in the
+text size no matter how many bids the page holds.
+"""
+import re
+
+# The one list of position codes; parse, fetch and synthetic_league import it
+POSITION_CODES = ('SP', 'RP', 'C', '1B', '2B', '3B', 'SS', 'OF', 'DH', 'UT', 'P')
+POSITION = f"(?:{'|'.join(POSITION_CODES)})"
+MONTH = r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)'
+DAY = r'(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun)'
+
+# Token kinds
+POSITIONS = 'positions'
+TEAM = 'team'
+PTY = 'pty'
+BID = 'bid'
+SUBMITTED = 'submitted'
+DEADLINE = 'deadline'
+TIMESTAMP = 'timestamp'
+LABEL = 'label'
+CLAIMS_HEADER = 'claims_header'
+BUDGET = 'budget'
+MONEY = 'money'
+NUMBER = 'number'
+TEXT = 'text'
+
+# Alternation order matters: the first group that matches the whole line wins
+LINE_PATTERN = re.compile(
+    rf'(?P<{POSITIONS}>{POSITION}(?:,{POSITION})*)'
+    rf'|(?P<{TEAM}>-\s*[A-Z]{{2,3}})'
+    rf'|(?P<{PTY}>PTY)'
+    rf'|(?P<{BID}>BID)'
+    rf'|(?P<{SUBMITTED}>(?i:SUBMITTED)(?:\s*\([A-Z]+\))?)'
+    rf'|(?P<{DEADLINE}>{DAY}\s+{MONTH}\s+\d+,?\s+\d+:\d+\s+(?:AM|PM)(?:\s+[A-Z]{{2,4}})?)'
+    rf'|(?P<{TIMESTAMP}>{MONTH}\s+\d+,?\s+\d+:\d+\s+(?:AM|PM))'
+    rf'|(?P<{LABEL}>POS|STA|DEL)'
+    rf'|(?P<{CLAIMS_HEADER}>Free Agent Claims)'
+    rf'|(?P<{BUDGET}>Claim Budget Remaining:?(?:\s*\$\d+)?)'
+    rf'|(?P<{MONEY}>\$\d+)'
+    rf'|(?P<{NUMBER}>\d+)'
+)
+
+# Fixed UI strings resolve with a dict lookup before trying the pattern.
+# Keys are upper case: the page styles its column heads with text-transform,
+# so element.text says 'PTY' while the DOM text says 'Pty'.
+EXACT_TOKENS = {
+    'PTY': PTY,
+    'BID': BID,
+    'POS': LABEL,
+    'STA': LABEL,
+    'DEL': LABEL,
+    'FREE AGENT CLAIMS': CLAIMS_HEADER,
+    'CLAIM BUDGET REMAINING:': BUDGET,
+}
+EXACT_MAX_LENGTH = max(len(key) for key in EXACT_TOKENS)
+
+def tokenize(text):
+    """(kind, value) for every non-blank line"""
+    fullmatch = LINE_PATTERN.fullmatch
+    exact = EXACT_TOKENS.get
+    tokens = []
+    for line in text.split('\n'):
+        line = line.strip()
+        if not line:
+            continue
+        kind = exact(line.upper()) if len(line) <= EXACT_MAX_LENGTH else None
+        if kind is None:
+            match = fullmatch(line)
+            kind = match.lastgroup if match else TEXT
+        tokens.append((kind, line))
+    return tokens
+
+def _new_record(name, positions, team, claim_budget=None):
+    return {
+        'player_name': name,
+        'position': positions,
+        'team': team,
+        'priority': None,
+        'bid': None,
+        'bid_time': None,
+        'drop_player': None,
+        'claim_budget': claim_budget,
+    }
+
+def money(value):
+    """'$31' (or 'Claim Budget Remaining: $31') -> 31, None if there is no amount"""
+    digits = value[value.find('$') + 1:] if '$' in value else ''
+    return int(digits) if digits.isdigit() else None
+
+def debug_logger():
+    """The 'fantrax' diagnostics logger, set up on first use - logging costs more to import than the parsers"""
+    from fantrax_monitor.diagnostics import configure_logging
+    return configure_logging()
+
+def to_int(value):
+    """31, '31' or ' $31 ' -> 31; None for blanks and anything that isn't a whole number"""
+    try:
+        return int(str(value).strip().lstrip('$'))
+    except (TypeError, ValueError):
+        return None
+
+# Row fields that are whole numbers whichever extractor read them
+NUMBER_FIELDS = ('priority', 'bid', 'claim_budget')
+
+def with_numbers(row):
+    """The row with its NUMBER_FIELDS converted to int (None when blank), in place"""
+    for field in NUMBER_FIELDS:
+        if field in row:
+            row[field] = to_int(row[field])
+    return row
+
+def parse_pending_text(text):
+    """Bid records from pending-transaction text, each bid emitted once
+
+    A player block is a free-text line followed by a position list and a
+    '- TEAM' line. The block is a claim if PTY/BID/SUBMITTED follow it, and
+    otherwise the drop player for the claim before it. Each claim also gets
+    the "Claim Budget Remaining" of the team section it sits in.
+    """
+    logger = debug_logger()
+    records = []
+    budget = None           # claim budget of the current team section
+    current = None          # claim being filled in
+    scorer = None           # (name, positions, team) not yet known to be claim or drop
+    name = positions = None # name + position list waiting for the team line
+    expect = None           # field the next value token belongs to
+    prev_kind = prev_value = None
+    
+    def settle_scorer():
+        # A completed player block with no bid markers is the current claim's drop
+        nonlocal scorer
+        if scorer and current and not current['drop_player']:
+            current['drop_player'] = scorer[0]
+            logger.debug("lexer: %s drops %s", current['player_name'], scorer[0])
+        elif scorer:
+            logger.debug("lexer: skipped player block %s (%s) - no bid markers and no claim to drop it for",
+                         scorer[0], scorer[2])
+        scorer = None
+    
+    for kind, value in tokenize(text):
+        if positions is not None and kind != TEAM:
+            name = positions = None
+        
+        if expect == LABEL:
+            # POS/STA/DEL values describe the roster slot, not the bid
+            expect = None
+        elif kind == POSITIONS and prev_kind == TEXT:
+            name, positions = prev_value, value
+        elif kind == TEAM and positions is not None:
+            settle_scorer()
+            scorer = (name, positions, value.lstrip('-').strip())
+            name = positions = None
+        elif kind in (PTY, BID, SUBMITTED):
+            if scorer:
+                current = _new_record(*scorer, claim_budget=budget)
+                records.append(current)
+                logger.debug("lexer: claim %s (%s) - %s, budget %s", *scorer, budget)
+                scorer = None
+            expect = kind if current else None
+        elif kind == NUMBER and expect == PTY:
+            current['priority'] = int(value)
+            expect = None
+        elif kind == NUMBER and expect == BID:
+            current['bid'] = int(value)
+            expect = None
+        elif kind == TIMESTAMP and expect == SUBMITTED:
+            current['bid_time'] = value
+            expect = None
+        elif kind == MONEY and expect == BUDGET:
+            budget = money(value)
+            expect = None
+        elif kind == LABEL:
+            expect = LABEL
+        elif kind in (CLAIMS_HEADER, BUDGET):
+            # A new team section: its budget is on this line or the next
+            settle_scorer()
+            current = None
+            budget = money(value) if kind == BUDGET else None
+            expect = BUDGET if kind == BUDGET and budget is None else None
+        else:
+            expect = None
+        
+        prev_kind, prev_value = kind, value
+    
+    settle_scorer()
+    logger.debug("lexer: %d claims from %d characters", len(records), len(text))
+    return records
+
+def bid_identity(record):
+    """Key that identifies one pending claim row (the same player can be claimed by several teams)"""
+    return (record['player_name'].lower(), record.get('team'), record.get('bid_time'), record.get('drop_player'))
+
+def outermost_texts(read_text, parents, keep):
+    """Texts that keep() accepts, skipping every element inside one already kept
+
+    parents[i] is the index of element i's parent (-1 at the top). Elements
+    come in document order, so an ancestor is seen before its descendants and
+    its text already contains theirs. An element inside a kept one is skipped
+    without calling read_text(i), so every bid line is parsed once and the
+    dedupe is one list lookup per element rather than a substring scan.
+    read_text(i) may return None for an element whose text can't be read.
+    """
+    kept = []
+    covered = [False] * len(parents)
+    for index, parent in enumerate(parents):
+        if 0 <= parent < index and covered[parent]:
+            covered[index] = True
+            continue
+        text = read_text(index)
+        if text is not None and keep(text):
+            covered[index] = True
+            kept.append(text)
+    return kept
@@ -0,0 +1,203 @@
+"""Scrape -> dedupe -> render -> send in one process, on typed in-memory records.
+
+The two-script flow (fantrax_scraper.py writes auction_players.json and
+email_summary.txt, Email_results.py reads them back and regex-scrapes the
+deadline out of the text) still works, but this path never touches the
+files unless asked to, and carries the claim deadline as a datetime.
+
+Once a claim period's full list has been mailed, later alerts carry only
+the bids added, withdrawn or changed since the last email, plus a full
+digest every "digest_hours" (config.json / FANTRAX_DIGEST_HOURS) if set.
+With "subscribers" in config.json each subscriber gets one message with
+just the bids its filters match (see subscriptions.py):
+
+    python fantrax_scraper.py --email [--backend http] [--artifacts]
+"""
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import List, Optional
+
+from fantrax_monitor import snapshot_state
+from fantrax_monitor.diagnostics import dump_diagnostics
+from fantrax_monitor.fetch import fetch_auction_data, load_credentials, record_history
+from fantrax_monitor.parse import parse_deadline
+from fantrax_monitor.render import build_delta_summary, build_summary, print_changes, save_results
+from fantrax_monitor.pending_lexer import bid_identity, to_int
+from fantrax_monitor.settings import LEAGUE_ID
+from fantrax_monitor.subscriptions import index_from_config
+from fantrax_monitor.timing import PhaseTimer
+
+@dataclass
+class BidRecord:
+    """One pending claim"""
+    player_name: str
+    position: Optional[str] = None
+    team: Optional[str] = None
+    priority: Optional[int] = None
+    bid: Optional[int] = None
+    bid_time: Optional[str] = None
+    drop_player: Optional[str] = None
+    claim_budget: Optional[int] = None
+    fantasy_team: Optional[str] = None
+    
+    @classmethod
+    def from_dict(cls, player):
+        return cls(player['player_name'], player.get('position'), player.get('team'),
+                   to_int(player.get('priority')), to_int(player.get('bid')),
+                   player.get('bid_time'), player.get('drop_player'),
+                   to_int(player.get('claim_budget')), player.get('fantasy_team'))
+    
+    def to_dict(self):
+        return asdict(self)
+
+@dataclass
+class PendingClaims:
+    """Everything one run knows about a league's pending claims"""
+    league_id: str
+    deadline_text: Optional[str]
+    deadline: Optional[datetime]
+    bids: List[BidRecord] = field(default_factory=list)
+    
+    def players(self):
+        """Bids as the player dicts save_results/build_summary/snapshot_state use"""
+        return [dict(bid.to_dict(), deadline=self.deadline_text) for bid in self.bids]
+
+def dedupe(players):
+    """Drop repeated claim rows, keeping the first"""
+    seen = set()
+    unique = []
+    for player in players:
+        if not player.get('player_name'):
+            continue
+        key = bid_identity(player)
+        if key not in seen:
+            seen.add(key)
+            unique.append(player)
+    return unique
+
+def scrape(backend, username, password, league_id=LEAGUE_ID, timer=None):
+    """Fetch and dedupe one league into PendingClaims"""
+    players, deadline_text, page_fingerprint = fetch_auction_data(backend, username, password, league_id, timer)
+    unique = dedupe(players)
+    if timer:
+        timer.count('duplicates_dropped', len(players) - len(unique))
+    claims = PendingClaims(league_id, deadline_text, parse_deadline(deadline_text),
+                           [BidRecord.from_dict(player) for player in unique])
+    return claims, page_fingerprint
+
+def subscriber_bodies(index, players, deadline_text, kind, delta, league_id=None):
+    """email -> message body for every subscriber with matching bids"""
+    from fantrax_monitor.notify import no_players_body
+    if not players:
+        return {email: no_players_body() for email in index.emails}
+    routed = index.route(players, league_id)
+    if kind != 'delta':
+        return {email: build_summary(matched, deadline_text) for email, matched in routed.items()}
+    
+    added = index.route(delta.added, league_id)
+    removed = index.route(delta.removed, league_id)
+    updated = index.route(delta.updated, league_id, bid=lambda pair: pair[1])
+    bodies = {}
+    for email in index.emails:
+        if email in added or email in removed or email in updated:
+            change = snapshot_state.SnapshotChange(True, added.get(email, []), removed.get(email, []),
+                                                   delta.fingerprint, updated.get(email, []))
+            bodies[email] = build_delta_summary(routed.get(email, []), deadline_text, change)
+    return bodies
+
+def send_to_subscribers(config, index, players, deadline_text, kind, delta, transport=None, timer=None,
+                        league_id=None, deadline=None):
+    """One tailored message per matching subscriber, all over one SMTP connection"""
+    from fantrax_monitor.notify import send_summary
+    from fantrax_monitor.mail_transport import transport_from_config
+    with timer.phase('render'):
+        bodies = subscriber_bodies(index, players, deadline_text, kind, delta, league_id)
+    if not bodies:
+        print("✓ No subscriber's filters match the changes - not sending")
+        snapshot_state.mark_emailed(kind == 'digest')
+        return True
+    
+    print(f"Sending {'full digest' if kind == 'digest' else 'changes only'} to {len(bodies)} of {len(index)} subscribers")
+    own_transport = transport is None
+    transport = transport or transport_from_config(config, timer)
+    try:
+        sent = [send_summary(config, body, deadline, bool(players), transport, timer, to=email, mark=False)
+                for email, body in bodies.items()]
+    finally:
+        if own_transport:
+            transport.close()
+    if all(sent):
+        snapshot_state.mark_emailed(kind == 'digest')
+    return all(sent)
+
+def send_alert(config, players, deadline_text, transport=None, timer=None, force=False, index=None,
+               league_id=None, deadline=None):
+    """Email the latest snapshot: the full list when a digest is due, otherwise only the delta
+
+    index is a compiled subscriptions.SubscriptionIndex (built from config if
+    not given); deadline is the parsed claim deadline (PendingClaims.deadline),
+    parsed from deadline_text when not given. Returns False only if a send failed.
+    """
+    from fantrax_monitor.notify import digest_hours, no_players_body, send_summary
+    if not force and snapshot_state.already_emailed():
+        print("✓ Pending bids unchanged since the last email - not sending")
+        return True
+    
+    timer = timer or PhaseTimer()
+    deadline = deadline or parse_deadline(deadline_text)
+    kind, delta = ('digest', None) if force else snapshot_state.pending_alert(digest_hours(config))
+    index = index or index_from_config(config)
+    if index is not None:
+        return send_to_subscribers(config, index, players, deadline_text, kind, delta, transport, timer, league_id,
+                                   deadline)
+    
+    with timer.phase('render'):
+        if not players:
+            kind, body = 'digest', no_players_body()
+        elif kind == 'delta':
+            body = build_delta_summary(players, deadline_text, delta)
+        else:
+            body = build_summary(players, deadline_text)
+    timer.count('email_bytes', len(body.encode('utf-8')))
+    print(f"Sending {'full digest' if kind == 'digest' else 'changes only'} ({len(body)} chars)")
+    return send_summary(config, body, deadline, bool(players), transport, timer, digest=kind == 'digest')
+
+def run_pipeline(backend='browser', league_id=LEAGUE_ID, email=True, artifacts=False, force=False):
+    """Scrape, record, render and (unless already sent) email in one go; returns PendingClaims or None"""
+    username, password = load_credentials()
+    if not username or not password:
+        print("Error: No credentials found")
+        return None
+    
+    timer = PhaseTimer()
+    try:
+        claims, page_fingerprint = scrape(backend, username, password, league_id, timer)
+    except Exception as e:
+        print(f"Error: {e}")
+        dump_diagnostics(f"Run failed: {e}")
+        return None
+    if not claims.bids:
+        dump_diagnostics("No players found")
+    
+    players = claims.players()
+    change = snapshot_state.record_snapshot(league_id, claims.deadline_text, players, page_fingerprint)
+    record_history(league_id, claims.deadline_text, players, change)
+    print_changes(change)
+    print(f"Found {len(claims.bids)} players being added")
+    
+    if artifacts:
+        with timer.phase('save'):
+            save_results(players, claims.deadline_text, change)
+    
+    if email:
+        from fantrax_monitor.notify import load_email_config
+        config = load_email_config()
+        if not config:
+            print("❌ No email configuration - not sending")
+        else:
+            send_alert(config, players, claims.deadline_text, timer=timer, force=force, league_id=league_id,
+                       deadline=claims.deadline)
+    
+    timer.report()
+    timer.write_report(backend=backend, league=league_id, players=len(claims.bids))
+    return claims
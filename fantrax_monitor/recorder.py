@@ -0,0 +1,295 @@
+"""Record a real run's Fantrax traffic and replay it offline through stub_server.py.
+
+While a recorder is active every response from the Fantrax origin is saved
+as a stub_server route (method, path, fxpa method, status, body and the
+recorded latency):
+
+  - http backend: a response hook on the requests.Session
+  - browser backend: Chrome's performance log plus Network.getResponseBody
+
+Request bodies (the login form!) are never stored and Set-Cookie values are
+replaced, but the responses still hold the account's league data - keep
+recordings out of git (recordings/ is ignored).
+
+    python -m fantrax_monitor.recorder record [recordings/run.json] [--backend http]
+    FANTRAX_RECORD=recordings/daemon.json python fantrax_scraper.py --daemon
+    python -m fantrax_monitor.recorder replay recordings/run.json [--backend browser] [--repeat 5] [--latency]
+
+Responses are kept in memory and the recording is written once, when the
+run ends (or on save()), so a long daemon session costs one write.
+
+Replays run in a temporary directory, so they never touch the real cookie
+cache, snapshot or history. Only same-origin responses are recorded; a page
+that loads scripts from other hosts still needs the network for those.
+"""
+import argparse
+import atexit
+import base64
+import io
+import json
+import os
+import statistics
+import tempfile
+import threading
+import time
+from contextlib import redirect_stdout
+from datetime import datetime
+from urllib.parse import urlsplit
+
+from fantrax_monitor.fantrax_http import base_url
+from fantrax_monitor.file_utils import write_json_atomic
+from fantrax_monitor.settings import LEAGUE_ID
+
+RECORDINGS_DIR = 'recordings'
+# Response headers worth replaying; the body is stored decoded, so no Content-Encoding/Length
+KEPT_HEADERS = {'content-type': 'Content-Type', 'location': 'Location'}
+# Cookie attributes that would stop the replaying browser from accepting the cookie on 127.0.0.1
+DROPPED_COOKIE_ATTRIBUTES = ('domain', 'secure', 'samesite')
+REDACTED = 'recorded'
+
+def fxpa_method(post_data):
+    """First fxpa message method in an /fxpa/req request body, or None"""
+    try:
+        return json.loads(post_data or '')['msgs'][0]['method']
+    except (KeyError, IndexError, TypeError, ValueError):
+        return None
+
+def redact_cookie(set_cookie):
+    """'FX_RM=secret; Domain=.fantrax.com; Path=/' -> 'FX_RM=recorded; Path=/'"""
+    name_value, *attributes = [part.strip() for part in set_cookie.split(';')]
+    name = name_value.split('=', 1)[0]
+    kept = [attribute for attribute in attributes
+            if attribute and attribute.split('=', 1)[0].strip().lower() not in DROPPED_COOKIE_ATTRIBUTES]
+    return '; '.join([f"{name}={REDACTED}"] + kept)
+
+def kept_headers(headers):
+    """The replayable subset of a response's headers, with cookies redacted"""
+    kept = {}
+    for name, value in (headers or {}).items():
+        if name.lower() in KEPT_HEADERS:
+            kept[KEPT_HEADERS[name.lower()]] = value
+        elif name.lower() == 'set-cookie':
+            # CDP joins repeated headers with newlines
+            kept['Set-Cookie'] = [redact_cookie(cookie) for cookie in str(value).split('\n') if cookie.strip()]
+    return kept
+
+def encoded_body(content, content_type):
+    """Route body fields for raw response bytes: parsed JSON, text, or base64"""
+    try:
+        text = content.decode('utf-8')
+    except UnicodeDecodeError:
+        return {'body_base64': base64.b64encode(content).decode('ascii')}
+    if 'json' in (content_type or ''):
+        try:
+            return {'body': json.loads(text)}
+        except ValueError:
+            pass
+    return {'body': text}
+
+class Recorder:
+    """Collects stub_server routes for one run in memory and writes the recording at exit"""
+    
+    def __init__(self, path, league_id=None, backend=None):
+        self.path = path
+        self.origin = urlsplit(base_url()).netloc
+        self.metadata = {'recorded_at': datetime.now().isoformat(timespec='seconds'),
+                         'league': league_id, 'backend': backend}
+        self.routes = []
+        self.saved_routes = None
+        self.lock = threading.Lock()
+        # Performance log state carried between batches (a request can span two reads)
+        self.unrecorded_log = []
+        self.sent = {}
+        self.received = {}
+        atexit.register(self.save)
+    
+    def add(self, method, url, fxpa, status, headers, content, elapsed):
+        if urlsplit(url).netloc != self.origin:
+            return
+        content_type = next((value for name, value in (headers or {}).items() if name.lower() == 'content-type'), None)
+        route = {'method': method, 'path': urlsplit(url).path}
+        if fxpa:
+            route['fxpa'] = fxpa
+        route.update({'status': status, 'headers': kept_headers(headers), 'elapsed': round(max(0, elapsed), 4)})
+        route.update(encoded_body(content, content_type))
+        with self.lock:
+            self.routes.append(route)
+    
+    def save(self):
+        """Atomically write the recording if it changed (compact JSON - page bundles can be large)"""
+        with self.lock:
+            if self.saved_routes == len(self.routes):
+                return
+            self.saved_routes = len(self.routes)
+            recording = dict(self.metadata, description=f"Recorded run, {len(self.routes)} responses",
+                             routes=list(self.routes))
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        write_json_atomic(self.path, recording, indent=None)
+    
+    def record_response(self, response, *args, **kwargs):
+        """requests response hook"""
+        headers = dict(response.headers)
+        headers.pop('Set-Cookie', None)
+        # requests folds repeated Set-Cookie headers together; rebuild them from the cookie jar
+        cookies = [f"{cookie.name}={REDACTED}; Path={cookie.path}" for cookie in response.cookies]
+        if cookies:
+            headers['Set-Cookie'] = '\n'.join(cookies)
+        self.add(response.request.method, response.request.url, fxpa_method(response.request.body),
+                 response.status_code, headers, response.content, response.elapsed.total_seconds())
+    
+    def read_log(self, driver):
+        """driver.get_log('performance'), keeping a copy of the entries for the recording"""
+        entries = driver.get_log('performance')
+        self.unrecorded_log += entries
+        return entries
+    
+    def record_driver(self, driver):
+        """Record every finished same-origin response in the performance log so far
+
+        Call it before navigating away: Chrome may evict the previous page's bodies.
+        """
+        entries, self.unrecorded_log = self.unrecorded_log + driver.get_log('performance'), []
+        for entry in entries:
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, TypeError, ValueError):
+                continue
+            params = message.get('params') or {}
+            request_id = params.get('requestId')
+            if message.get('method') == 'Network.requestWillBeSent':
+                request = params.get('request') or {}
+                post_data = request.get('postData')
+                if post_data is None and request.get('hasPostData'):
+                    try:
+                        post_data = driver.execute_cdp_cmd('Network.getRequestPostData',
+                                                           {'requestId': request_id}).get('postData')
+                    except Exception:
+                        pass
+                self.sent[request_id] = (request.get('method', 'GET'), request.get('url', ''),
+                                         fxpa_method(post_data), params.get('timestamp'))
+            elif message.get('method') == 'Network.responseReceived':
+                self.received[request_id] = params.get('response') or {}
+            elif message.get('method') == 'Network.loadingFinished' and request_id in self.received:
+                method, url, fxpa, started = self.sent.pop(request_id, ('GET', '', None, None))
+                response = self.received.pop(request_id)
+                if urlsplit(url or response.get('url', '')).netloc != self.origin:
+                    continue
+                try:
+                    result = driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id})
+                except Exception:
+                    continue
+                body = result.get('body', '')
+                content = base64.b64decode(body) if result.get('base64Encoded') else body.encode('utf-8')
+                elapsed = params.get('timestamp', 0) - started if started else 0
+                self.add(method, url or response.get('url', ''), fxpa, response.get('status', 200),
+                         response.get('headers'), content, elapsed)
+
+_active = None
+_active_lock = threading.Lock()
+
+def start_recording(path, league_id=None, backend=None):
+    """Make every session started from now on record into path"""
+    global _active
+    with _active_lock:
+        _active = Recorder(path, league_id, backend)
+        return _active
+
+def active():
+    """The running Recorder, started from FANTRAX_RECORD if set, or None"""
+    global _active
+    with _active_lock:
+        if _active is None and os.getenv('FANTRAX_RECORD'):
+            _active = Recorder(os.getenv('FANTRAX_RECORD'))
+        return _active
+
+def attach_session(session):
+    """Record a requests.Session's responses while a recording is active"""
+    recorder = active()
+    if recorder is not None:
+        session.hooks['response'].append(recorder.record_response)
+    return session
+
+def record_driver(driver):
+    """Record the browser's responses so far while a recording is active"""
+    recorder = active()
+    if recorder is not None and driver is not None:
+        recorder.record_driver(driver)
+
+def log_reader(driver):
+    """Function that drains the performance log, teeing entries into an active recording"""
+    recorder = active()
+    if recorder is not None:
+        return lambda: recorder.read_log(driver)
+    return lambda: driver.get_log('performance')
+
+def replay(path, backend='http', league_id=None, repeat=1, latency=False):
+    """Run get_auction_data() against the recording repeat times; returns the run times in seconds"""
+    from fantrax_monitor.fetch import get_auction_data
+    from fantrax_monitor.stub_server import load_recording, start_stub_server
+    
+    recording = load_recording(path)
+    league_id = league_id or recording.get('league') or LEAGUE_ID
+    server = start_stub_server(recording, latency=latency)
+    host, port = server.server_address[:2]
+    environment = {'FANTRAX_BASE_URL': f"http://{host}:{port}", 'FANTRAX_USERNAME': 'replay',
+                   'FANTRAX_PASSWORD': 'replay'}
+    saved_environment = {name: os.environ.get(name) for name in environment}
+    os.environ.update(environment)
+    original_dir = os.getcwd()
+    times = []
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            os.chdir(workdir)
+            for run in range(1, repeat + 1):
+                output = io.StringIO()
+                with redirect_stdout(output):
+                    start = time.perf_counter()
+                    players = get_auction_data(backend=backend, league_id=league_id)
+                    times.append(time.perf_counter() - start)
+                if run == 1:
+                    print(output.getvalue(), end='')
+                print(f"Run {run}: {times[-1] * 1000:.1f} ms, {len(players)} players")
+            # Leave the directory before it is removed (Windows can't delete the cwd)
+            os.chdir(original_dir)
+    finally:
+        os.chdir(original_dir)
+        server.shutdown()
+        server.server_close()
+        for name, value in saved_environment.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+    return times
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Record a Fantrax run, or replay a recording offline")
+    commands = parser.add_subparsers(dest='command', required=True)
+    record_parser = commands.add_parser('record', help="run the scraper against fantrax.com and save its traffic")
+    record_parser.add_argument('path', nargs='?', help="recording file (default recordings/<timestamp>.json)")
+    replay_parser = commands.add_parser('replay', help="run the scraper against a recording")
+    replay_parser.add_argument('path', help="recording file")
+    replay_parser.add_argument('--repeat', type=int, default=1, help="runs to time")
+    replay_parser.add_argument('--latency', action='store_true', help="delay each response by its recorded latency")
+    for command_parser in (record_parser, replay_parser):
+        command_parser.add_argument('--backend', choices=['browser', 'http'], default=None,
+                                    help="browser or http; also FANTRAX_BACKEND")
+        command_parser.add_argument('--league', default=None, help="Fantrax league ID")
+    args = parser.parse_args()
+    backend = args.backend or os.getenv('FANTRAX_BACKEND', 'browser')
+    
+    if args.command == 'record':
+        from fantrax_monitor.fetch import get_auction_data
+        path = args.path or os.path.join(RECORDINGS_DIR, f"{datetime.now():%Y%m%d-%H%M%S}-{backend}.json")
+        recorder = start_recording(path, args.league or LEAGUE_ID, backend)
+        get_auction_data(backend=backend, league_id=args.league or LEAGUE_ID)
+        recorder.save()
+        print(f"✓ Recorded {len(recorder.routes)} responses to {path}")
+    else:
+        os.environ.pop('FANTRAX_RECORD', None)
+        times = replay(args.path, backend, args.league, args.repeat, args.latency)
+        if len(times) > 1:
+            print(f"Median {statistics.median(times) * 1000:.1f} ms over {len(times)} runs "
+                  f"(min {min(times) * 1000:.1f}, max {max(times) * 1000:.1f})")
@@ -0,0 +1,121 @@
+"""Renderers: the console report, the alert email bodies and the saved result files."""
+import json
+
+# Claim fields that can change while the claim stays the same (see snapshot_state.CLAIM_FIELDS)
+UPDATE_LABELS = [('priority', 'priority'), ('bid', 'bid'), ('drop_player', 'dropping'), ('position', 'position')]
+
+def describe_update(previous, current):
+    """'bid 3 -> 5, dropping - -> Jo Adell' for one claim whose details changed"""
+    return ', '.join(f"{label} {previous.get(field) or '-'} -> {current.get(field) or '-'}"
+                     for field, label in UPDATE_LABELS
+                     if str(previous.get(field) or '') != str(current.get(field) or ''))
+
+def describe_bid(player):
+    """'$4 (priority 1, $31 budget left)', or None when the row had no bid details"""
+    details = []
+    if player.get('priority') is not None:
+        details.append(f"priority {player['priority']}")
+    if player.get('claim_budget') is not None:
+        details.append(f"${player['claim_budget']} budget left")
+    if player.get('bid') is None and not details:
+        return None
+    bid = f"${player['bid']}" if player.get('bid') is not None else "Unknown"
+    return bid + (f" ({', '.join(details)})" if details else "")
+
+def print_changes(change):
+    """Show which bids appeared, disappeared or changed since the last run"""
+    if not change.added and not change.removed and not change.updated:
+        return
+    print("Changes since last check:")
+    for player in change.added:
+        print(f"  + {player['player_name']} ({player.get('position')}) - {player.get('team', 'Unknown')}")
+    for player in change.removed:
+        print(f"  - {player['player_name']} ({player.get('position')}) - {player.get('team', 'Unknown')}")
+    for previous, player in change.updated:
+        print(f"  ~ {player['player_name']} ({player.get('position')}) - {describe_update(previous, player)}")
+
+def build_summary(all_players, auction_deadline, change=None):
+    """The email_summary.txt body for one league's pending claims"""
+    deadline_text = f" - Deadline {auction_deadline.split(',')[0]}" if auction_deadline else ""
+    email_text = f"Fantasy Baseball Auction Alert{deadline_text}\n\n"
+    
+    if auction_deadline:
+        email_text += f"Auction Deadline: {auction_deadline}\n\n"
+    
+    if change and (change.added or change.removed or change.updated):
+        email_text += "Changes since last check:\n"
+        for player in change.added:
+            email_text += f"   New: {player['player_name']} ({player.get('position')}) - {player.get('team', 'Unknown')}\n"
+        for player in change.removed:
+            email_text += f"   Withdrawn: {player['player_name']} ({player.get('position')}) - {player.get('team', 'Unknown')}\n"
+        for previous, player in change.updated:
+            email_text += f"   Changed: {player['player_name']} ({player.get('position')}) - {describe_update(previous, player)}\n"
+        email_text += "\n"
+    
+    email_text += f"Found {len(all_players)} player(s) being added:\n\n"
+    
+    for i, player in enumerate(all_players, 1):
+        email_text += f"{i}. {player['player_name']}\n"
+        email_text += f"   Position: {player['position']}\n"
+        email_text += f"   Team: {player.get('team', 'Unknown')}\n"
+        if describe_bid(player):
+            email_text += f"   Bid: {describe_bid(player)}\n"
+        if player.get('drop_player'):
+            email_text += f"   Dropping: {player['drop_player']}\n"
+        email_text += "\n"
+    
+    return email_text
+
+def build_delta_summary(all_players, auction_deadline, change):
+    """Email body with only the claims added, withdrawn or changed since the last email"""
+    deadline_text = f" - Deadline {auction_deadline.split(',')[0]}" if auction_deadline else ""
+    email_text = f"Fantasy Baseball Auction Update{deadline_text}\n\n"
+    
+    if auction_deadline:
+        email_text += f"Auction Deadline: {auction_deadline}\n\n"
+    
+    total = len(change.added) + len(change.removed) + len(change.updated)
+    email_text += f"{total} change(s) since the last email - {len(all_players)} player(s) being added in total.\n\n"
+    
+    if change.added:
+        email_text += "New:\n\n"
+        for i, player in enumerate(change.added, 1):
+            email_text += f"{i}. {player['player_name']}\n"
+            email_text += f"   Position: {player.get('position')}\n"
+            email_text += f"   Team: {player.get('team', 'Unknown')}\n"
+            if describe_bid(player):
+                email_text += f"   Bid: {describe_bid(player)}\n"
+            if player.get('drop_player'):
+                email_text += f"   Dropping: {player['drop_player']}\n"
+            email_text += "\n"
+    
+    if change.updated:
+        email_text += "Changed:\n"
+        for previous, player in change.updated:
+            email_text += f"   {player['player_name']} ({player.get('position')}) - {describe_update(previous, player)}\n"
+        email_text += "\n"
+    
+    if change.removed:
+        email_text += "Withdrawn:\n"
+        for player in change.removed:
+            email_text += f"   {player['player_name']} ({player.get('position')}) - {player.get('team', 'Unknown')}\n"
+        email_text += "\n"
+    
+    return email_text
+
+def save_results(all_players, auction_deadline, change=None, suffix=''):
+    """Write auction_players{suffix}.json and the email_summary{suffix}.txt body"""
+    print(f"Found {len(all_players)} players being added:")
+    for i, player in enumerate(all_players, 1):
+        print(f"  {i}. {player['player_name']} ({player['position']}) - {player.get('team', 'Unknown')}")
+    
+    # Save results
+    with open(f'auction_players{suffix}.json', 'w') as f:
+        json.dump(all_players, f, indent=2)
+    
+    # Create email
+    if all_players:
+        with open(f'email_summary{suffix}.txt', 'w', encoding='utf-8') as f:
+            f.write(build_summary(all_players, auction_deadline, change))
+        
+        print(f"\n✓ Saved {len(all_players)} players to files")
@@ -0,0 +1,87 @@
+"""Reusable Fantrax login cookies, so runs can skip the UI login.
+
+Cookies are stored in Selenium's get_cookies() format and can be loaded into
+either a Chrome driver or a requests.Session. The cache holds live session
+cookies, so it defaults to .fantrax_cookies.json (one
+.fantrax_cookies_<hash>.json per extra account), which git ignores.
+"""
+import hashlib
+import json
+import os
+import time
+from fantrax_monitor.file_utils import write_json_atomic
+
+COOKIE_CACHE = os.getenv('FANTRAX_COOKIE_CACHE', '.fantrax_cookies.json')
+# Treat cookies this close to expiry as already expired
+EXPIRY_MARGIN = 60
+
+def account_cache_path(username, default_username=None):
+    """Cookie cache for one Fantrax account; the default account keeps COOKIE_CACHE"""
+    if not username or username == default_username:
+        return COOKIE_CACHE
+    stem, ext = os.path.splitext(COOKIE_CACHE)
+    return f"{stem}_{hashlib.sha1(username.lower().encode('utf-8')).hexdigest()[:10]}{ext}"
+
+def load_cookies(path=COOKIE_CACHE, now=None):
+    """Unexpired cookies from the cache, or [] if there is nothing usable"""
+    try:
+        with open(path, 'r') as f:
+            cookies = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return []
+    
+    if not isinstance(cookies, list):
+        return []
+    
+    now = now if now is not None else time.time()
+    # Cookies without an expiry are session cookies - keep them and let the
+    # server decide whether the session is still good
+    return [cookie for cookie in cookies
+            if cookie.get('name') and
+            (cookie.get('expiry') is None or cookie['expiry'] > now + EXPIRY_MARGIN)]
+
+def save_cookies(cookies, path=COOKIE_CACHE):
+    """Atomically rewrite the cache so a crash never leaves half a file behind"""
+    write_json_atomic(path, cookies)
+
+def apply_to_driver(driver, cookies):
+    """Install cookies through CDP so no page has to be loaded first"""
+    driver.execute_cdp_cmd('Network.enable', {})
+    for cookie in cookies:
+        params = {
+            'name': cookie['name'],
+            'value': cookie.get('value', ''),
+            'domain': cookie.get('domain', 'www.fantrax.com'),
+            'path': cookie.get('path', '/'),
+            'secure': cookie.get('secure', False),
+            'httpOnly': cookie.get('httpOnly', False),
+        }
+        if cookie.get('sameSite') in ('Strict', 'Lax', 'None'):
+            params['sameSite'] = cookie['sameSite']
+        if cookie.get('expiry') is not None:
+            params['expires'] = cookie['expiry']
+        driver.execute_cdp_cmd('Network.setCookie', params)
+
+def apply_to_session(session, cookies):
+    """Load cached cookies into a requests.Session"""
+    for cookie in cookies:
+        session.cookies.set(cookie['name'], cookie.get('value', ''),
+                            domain=cookie.get('domain'), path=cookie.get('path', '/'),
+                            secure=cookie.get('secure', False), expires=cookie.get('expiry'))
+
+def session_cookies(session):
+    """A requests.Session's cookies in the same format as driver.get_cookies()"""
+    cookies = []
+    for cookie in session.cookies:
+        entry = {
+            'domain': cookie.domain,
+            'httpOnly': bool(cookie.has_nonstandard_attr('HttpOnly')),
+            'name': cookie.name,
+            'path': cookie.path,
+            'secure': bool(cookie.secure),
+            'value': cookie.value,
+        }
+        if cookie.expires is not None:
+            entry['expiry'] = cookie.expires
+        cookies.append(entry)
+    return cookies
@@ -0,0 +1,14 @@
+"""Shared settings: the default league and the one reader of config.json."""
+import json
+
+CONFIG_PATH = 'config.json'
+LEAGUE_ID = "vqsvwdkem1uv2c8b"
+
+def load_config():
+    """config.json as a dict, or None when it is missing or not valid JSON"""
+    try:
+        with open(CONFIG_PATH, 'r') as f:
+            config = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return config if isinstance(config, dict) else None
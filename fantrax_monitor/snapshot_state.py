@@ -0,0 +1,136 @@
+"""Remembers the last pending-bid snapshot per league and claim deadline.
+
+Lets a run skip parsing when the pending page text has not changed, and lets
+Email_results.py skip sending when the bids are the same as the last email.
+The bids last emailed are kept too, so the next alert can carry only what
+was added, withdrawn or changed since then (see pending_alert()).
+"""
+import hashlib
+import json
+import os
+from collections import namedtuple
+from datetime import datetime
+from fantrax_monitor.file_utils import write_json_atomic
+
+STATE_FILE = os.getenv('FANTRAX_STATE_FILE', 'snapshot_state.json')
+# Fields that identify a bid; anything else (e.g. display-only text) is ignored
+BID_FIELDS = ('player_name', 'position', 'team', 'bid_time', 'drop_player', 'priority', 'bid')
+# The same claim across snapshots - its other BID_FIELDS may change (re-prioritised, new drop...)
+CLAIM_FIELDS = ('player_name', 'team', 'bid_time')
+MAX_SNAPSHOTS = 50
+
+# updated holds (previous, current) pairs for claims whose other fields changed
+SnapshotChange = namedtuple('SnapshotChange', ['changed', 'added', 'removed', 'fingerprint', 'updated'],
+                            defaults=((),))
+
+def normalize_bid(player, fields=BID_FIELDS):
+    """Whitespace/case-normalized tuple identifying one bid"""
+    return tuple(' '.join(str(player.get(field) or '').split()).lower() for field in fields)
+
+def diff_bids(old_players, new_players):
+    """(added, removed, updated) between two bid lists, keyed by CLAIM_FIELDS - one pass over each"""
+    old_claims = {normalize_bid(player, CLAIM_FIELDS): player for player in old_players}
+    new_claims = {normalize_bid(player, CLAIM_FIELDS): player for player in new_players}
+    added = [player for key, player in new_claims.items() if key not in old_claims]
+    removed = [player for key, player in old_claims.items() if key not in new_claims]
+    updated = [(old_claims[key], player) for key, player in new_claims.items()
+               if key in old_claims and normalize_bid(old_claims[key]) != normalize_bid(player)]
+    return added, removed, updated
+
+def normalize_bids(players):
+    """Sorted, de-duplicated bid tuples for fingerprinting"""
+    return sorted({normalize_bid(player) for player in players})
+
+def fingerprint(value):
+    """Stable sha256 of any JSON-serialisable value"""
+    return hashlib.sha256(json.dumps(value, sort_keys=True).encode('utf-8')).hexdigest()
+
+def text_fingerprint(text):
+    """Fingerprint of raw page text with whitespace differences ignored"""
+    return fingerprint(' '.join((text or '').split()))
+
+def snapshot_key(league_id, deadline):
+    return f"{league_id}|{deadline or ''}"
+
+def load_state(path=STATE_FILE):
+    try:
+        with open(path, 'r') as f:
+            state = json.load(f)
+        return state if isinstance(state, dict) else {}
+    except (FileNotFoundError, ValueError):
+        return {}
+
+def save_state(state, path=STATE_FILE):
+    snapshots = state.get('snapshots', {})
+    # Oldest first (insertion order) - drop old claim periods
+    for key in list(snapshots)[:-MAX_SNAPSHOTS]:
+        del snapshots[key]
+    write_json_atomic(path, state)
+
+def cached_players(league_id, deadline, page_fingerprint, path=STATE_FILE):
+    """Players from the last snapshot if the raw page text is unchanged, else None"""
+    if not page_fingerprint:
+        return None
+    entry = load_state(path).get('snapshots', {}).get(snapshot_key(league_id, deadline))
+    if entry and entry.get('text_fingerprint') == page_fingerprint:
+        return entry.get('players', [])
+    return None
+
+def record_snapshot(league_id, deadline, players, page_fingerprint=None, path=STATE_FILE):
+    """Store this run's bids and return what changed since the last run for the same deadline"""
+    state = load_state(path)
+    snapshots = state.setdefault('snapshots', {})
+    key = snapshot_key(league_id, deadline)
+    previous = snapshots.pop(key, None) or {}
+    
+    bid_fingerprint = fingerprint(normalize_bids(players))
+    added, removed, updated = diff_bids(previous.get('players', []), players)
+    changed = previous.get('fingerprint') != bid_fingerprint
+    
+    snapshots[key] = {
+        'fingerprint': bid_fingerprint,
+        'text_fingerprint': page_fingerprint,
+        'players': players,
+        'seen_at': datetime.now().isoformat(),
+        'emailed_fingerprint': previous.get('emailed_fingerprint'),
+        'emailed_players': previous.get('emailed_players'),
+        'digest_at': previous.get('digest_at'),
+    }
+    state['latest'] = key
+    save_state(state, path)
+    return SnapshotChange(changed, added, removed, bid_fingerprint, updated)
+
+def latest_snapshot(path=STATE_FILE):
+    state = load_state(path)
+    return state.get('snapshots', {}).get(state.get('latest'))
+
+def already_emailed(path=STATE_FILE):
+    """True when the latest snapshot's bids were already sent"""
+    entry = latest_snapshot(path)
+    return bool(entry) and entry.get('emailed_fingerprint') == entry.get('fingerprint')
+
+def pending_alert(digest_hours=None, now=None, path=STATE_FILE):
+    """('digest', None) or ('delta', SnapshotChange since the last email) for the latest snapshot
+
+    A full digest goes out for the first email of a claim period and, when
+    digest_hours is set, once that many hours have passed since the last one.
+    """
+    entry = latest_snapshot(path)
+    if not entry or entry.get('emailed_players') is None or not entry.get('digest_at'):
+        return 'digest', None
+    now = now or datetime.now()
+    if digest_hours and (now - datetime.fromisoformat(entry['digest_at'])).total_seconds() >= digest_hours * 3600:
+        return 'digest', None
+    added, removed, updated = diff_bids(entry['emailed_players'], entry.get('players', []))
+    return 'delta', SnapshotChange(bool(added or removed or updated), added, removed, entry['fingerprint'], updated)
+
+def mark_emailed(digest=True, path=STATE_FILE):
+    """Remember the latest snapshot's bids as sent (and when the last full digest went out)"""
+    state = load_state(path)
+    entry = state.get('snapshots', {}).get(state.get('latest'))
+    if entry:
+        entry['emailed_fingerprint'] = entry['fingerprint']
+        entry['emailed_players'] = entry.get('players', [])
+        if digest:
+            entry['digest_at'] = datetime.now().isoformat()
+        save_state(state, path)
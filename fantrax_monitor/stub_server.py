@@ -0,0 +1,142 @@
+"""Local stand-in for fantrax.com that replays recorded responses.
+
+A recording is a JSON file with a list of routes. Each route matches on the
+HTTP method, the URL path and (for /fxpa/req) the fxpa message method:
+
+    {"routes": [{"method": "POST", "path": "/fxpa/req", "fxpa": "login",
+                 "status": 200, "headers": {...}, "body": {...}}]}
+
+A request recorded several times replays its responses in order, then keeps
+repeating the last one. Binary bodies are stored as "body_base64", and
+"elapsed" (seconds) is the recorded latency, replayed with --latency.
+recorder.py writes recordings of real runs.
+
+    python -m fantrax_monitor.stub_server fixtures/pending_transactions.json --port 8765
+    python -m fantrax_monitor.stub_server --synthetic 1000 --teams 12   # generated league, see synthetic_league.py
+    FANTRAX_BASE_URL=http://127.0.0.1:8765 python fantrax_scraper.py --backend http
+"""
+import argparse
+import base64
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+def load_recording(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def find_route(routes, method, path, fxpa_method, served=None):
+    """First matching route not yet in served (the last match once all are), or None
+
+    served is a set of route indexes that is updated in place; without it the
+    first matching route always wins.
+    """
+    match = None
+    for index, route in enumerate(routes):
+        if route.get('method', 'GET') != method or route.get('path') != path:
+            continue
+        if route.get('fxpa') and route['fxpa'] != fxpa_method:
+            continue
+        match = index
+        if served is None or index not in served:
+            break
+    if match is None:
+        return None
+    if served is not None:
+        served.add(match)
+    return routes[match]
+
+def make_handler(recording, latency=False):
+    routes = recording.get('routes', [])
+    served = set()
+    served_lock = threading.Lock()
+    
+    class ReplayHandler(BaseHTTPRequestHandler):
+        # HTTP/1.1 so clients can reuse one keep-alive connection
+        protocol_version = 'HTTP/1.1'
+        
+        def replay(self):
+            length = int(self.headers.get('Content-Length') or 0)
+            request_body = self.rfile.read(length) if length else b''
+            fxpa_method = None
+            if request_body:
+                try:
+                    fxpa_method = json.loads(request_body)['msgs'][0]['method']
+                except (ValueError, KeyError, IndexError, TypeError):
+                    pass
+            
+            with served_lock:
+                route = find_route(routes, self.command, urlsplit(self.path).path, fxpa_method, served)
+            if route is None:
+                status, headers, body = 404, {'Content-Type': 'text/plain'}, b'no recorded response'
+            else:
+                status = route.get('status', 200)
+                headers = dict(route.get('headers') or {})
+                body = route.get('body', '')
+                if 'body_base64' in route:
+                    body = base64.b64decode(route['body_base64'])
+                elif isinstance(body, (dict, list)):
+                    body = json.dumps(body).encode('utf-8')
+                    headers.setdefault('Content-Type', 'application/json')
+                else:
+                    body = body.encode('utf-8')
+                if latency:
+                    time.sleep(route.get('elapsed', 0))
+            
+            self.send_response(status)
+            for name, values in headers.items():
+                # A list repeats the header (several Set-Cookie lines)
+                for value in values if isinstance(values, list) else [values]:
+                    self.send_header(name, value)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        
+        do_GET = replay
+        do_POST = replay
+        
+        def log_message(self, format, *args):
+            pass
+    
+    return ReplayHandler
+
+def start_stub_server(recording, host='127.0.0.1', port=0, latency=False):
+    """Serve a recording on a background thread; returns the server (see server_address)"""
+    if isinstance(recording, str):
+        recording = load_recording(recording)
+    server = ThreadingHTTPServer((host, port), make_handler(recording, latency))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay recorded Fantrax responses locally")
+    parser.add_argument('recording', nargs='?', help="JSON recording of routes to replay")
+    parser.add_argument('--synthetic', type=int, metavar='BIDS',
+                        help="serve a generated league with this many claims instead of a recording")
+    parser.add_argument('--teams', type=int, default=12, help="--synthetic only: fantasy teams in the league")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', action='store_true', help="delay each response by its recorded \"elapsed\"")
+    args = parser.parse_args()
+    
+    if args.synthetic is not None:
+        from fantrax_monitor.synthetic_league import generate_league, render_recording
+        recording = render_recording(generate_league(args.teams, args.synthetic, args.synthetic // 4))
+        source = recording['description']
+    elif args.recording:
+        recording = load_recording(args.recording)
+        source = args.recording
+    else:
+        parser.error("give a recording file or --synthetic BIDS")
+    
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(recording, args.latency))
+    print(f"Replaying {source} on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -0,0 +1,129 @@
+"""Per-recipient alert filters, compiled once into lookup tables.
+
+config.json can list subscribers instead of (or as well as) email_to; each
+one gets a single message per run with only the bids that match every
+filter it sets (a missing filter matches anything):
+
+    "subscribers": [
+        {"email": "me@example.com"},
+        {"email": "pitching@example.com", "positions": ["SP", "RP"]},
+        {"email": "fan@example.com", "teams": ["NYY", "BOS"], "leagues": ["Dynasty"]},
+        {"email": "scout@example.com", "players": ["Jo Adell", "Royce Lewis"]}
+    ]
+
+"players" matches the claimed or the dropped player; "leagues" matches a
+league id or name. email_to (with email_cc) stays a recipient of everything:
+its addresses are routed as one more subscriber without filters, except for
+any address also listed under "subscribers", whose filters then apply.
+
+SubscriptionIndex turns the filters into value -> subscriber bitmask tables, so routing one bid is a handful of dict
+lookups and integer ANDs/ORs however many subscribers there are.
+"""
+import re
+import unicodedata
+
+def normalize_name(name):
+    """'Ronald Acuña Jr.' -> 'ronald acuna jr'"""
+    decomposed = unicodedata.normalize('NFKD', name or '')
+    stripped = ''.join(char for char in decomposed if not unicodedata.combining(char))
+    return ' '.join(stripped.replace('.', '').casefold().split())
+
+FILTERS = ('positions', 'teams', 'players', 'leagues')
+POSITION_SEPARATORS = re.compile(r'[,/\s]+')
+
+def normalize_value(field, value):
+    if field == 'players':
+        return normalize_name(value)
+    return ' '.join(str(value).split()).lower()
+
+def bid_values(field, player, league_id=None):
+    """The normalised values a bid offers for one filter"""
+    if field == 'positions':
+        return [position.lower() for position in POSITION_SEPARATORS.split(player.get('position') or '') if position]
+    if field == 'teams':
+        return [normalize_value(field, player['team'])] if player.get('team') else []
+    if field == 'players':
+        return [normalize_name(name) for name in (player.get('player_name'), player.get('drop_player')) if name]
+    return [normalize_value(field, league) for league in (player.get('league'), player.get('league_id'), league_id)
+            if league]
+
+class SubscriptionIndex:
+    """value -> subscriber bitmask (bit i = self.emails[i]) for every filter"""
+    
+    def __init__(self, subscribers):
+        self.emails = []
+        self.tables = {field: {} for field in FILTERS}
+        # Subscribers that don't filter on a field match every bid for it
+        self.unfiltered = {field: 0 for field in FILTERS}
+        for subscriber in subscribers:
+            email = (subscriber.get('email') or '').strip()
+            if not email:
+                continue
+            bit = 1 << len(self.emails)
+            self.emails.append(email)
+            for field in FILTERS:
+                values = subscriber.get(field)
+                if isinstance(values, str):
+                    values = [values]
+                if not values:
+                    self.unfiltered[field] |= bit
+                    continue
+                table = self.tables[field]
+                for value in values:
+                    key = normalize_value(field, value)
+                    table[key] = table.get(key, 0) | bit
+    
+    def __len__(self):
+        return len(self.emails)
+    
+    def match(self, player, league_id=None):
+        """Bitmask of the subscribers that want this bid"""
+        matched = (1 << len(self.emails)) - 1
+        for field in FILTERS:
+            table = self.tables[field]
+            candidates = self.unfiltered[field]
+            for value in bid_values(field, player, league_id):
+                candidates |= table.get(value, 0)
+            matched &= candidates
+            if not matched:
+                break
+        return matched
+    
+    def route(self, items, league_id=None, bid=None):
+        """email -> the items (in order) that subscriber should get; subscribers with none are left out
+
+        bid picks the player dict out of each item (e.g. the current side of an (old, new) pair).
+        """
+        routed = {}
+        for item in items:
+            matched = self.match(bid(item) if bid else item, league_id)
+            while matched:
+                lowest = matched & -matched
+                routed.setdefault(self.emails[lowest.bit_length() - 1], []).append(item)
+                matched ^= lowest
+        return routed
+
+def split_addresses(addresses):
+    """'a@example.com; b@example.com' -> ['a@example.com', 'b@example.com']"""
+    return [address.strip() for address in (addresses or '').split(';') if address.strip()]
+
+def unlisted_email_to(config):
+    """The email_to addresses that aren't also subscribers, joined with '; ' (email_cc rides on these)"""
+    listed = {(subscriber.get('email') or '').strip().lower() for subscriber in config.get('subscribers') or []}
+    return '; '.join(address for address in split_addresses(config.get('email_to'))
+                     if address.lower() not in listed)
+
+def index_from_config(config):
+    """SubscriptionIndex for config "subscribers" plus email_to
+
+    None when the config has no subscribers.
+    """
+    subscribers = (config or {}).get('subscribers')
+    if not subscribers:
+        return None
+    subscribers = list(subscribers)
+    email_to = unlisted_email_to(config)
+    if email_to:
+        subscribers.append({'email': email_to})
+    index = SubscriptionIndex(subscribers)
+    return index if len(index) else None
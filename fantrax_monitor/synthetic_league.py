@@ -0,0 +1,177 @@
+"""Synthetic Fantrax leagues for scale testing the parsers and fetch path.
+
+generate_league() builds a getPendingTransactions payload (the shape
+fantrax_monitor.parse.parse_pending_transactions reads) and the render
+functions turn it into the pending page's HTML, its text layout, or a
+stub_server recording:
+
+    python -m fantrax_monitor.synthetic_league --teams 12 --bids 500 --drops 120 --text pending.txt --html pending.html
+    python -m fantrax_monitor.stub_server --synthetic 500 --teams 12
+"""
+import argparse
+import json
+import random
+from datetime import datetime, timedelta
+from html import escape
+
+from fantrax_monitor.pending_lexer import POSITION_CODES
+from fantrax_monitor.settings import LEAGUE_ID
+
+FIRST_NAMES = ['Jo', 'Will', 'Royce', 'Adrian', 'Michael', 'Davis', 'Justin', 'Jordan', 'Tyler', 'Luis',
+               'Carlos', 'Jake', 'Ryan', 'Matt', 'Nick', 'Jose', 'Kyle', 'Chris', 'Brandon', 'Andres']
+LAST_NAMES = ['Adell', 'Warren', 'Lewis', 'Houser', 'Kopech', 'Martin', 'Martinez', 'Walker', 'Rogers',
+              'Garcia', 'Santana', 'Burger', 'Pepiot', 'Lodolo', 'Castellanos', 'Ramirez', 'Tucker',
+              'Gimenez', 'Wells', 'Abreu', 'Bader', 'Turang', 'Canha', 'Senga', 'Duran']
+# Every single position, plus some multi-position players
+POSITIONS = list(POSITION_CODES) + ['SP,RP', '1B,3B,OF', '2B,SS', 'OF,DH']
+MLB_TEAMS = ['LAA', 'NYY', 'MIN', 'CHW', 'LAD', 'ARI', 'ATL', 'TOR', 'SEA', 'HOU', 'BOS', 'CLE', 'DET',
+             'SD', 'SF', 'TB', 'TEX', 'MIL', 'CIN', 'PIT']
+DEFAULT_DEADLINE = datetime(2025, 6, 12, 2, 0)
+
+def format_deadline(when, zone='CDT'):
+    """'Thu Jun 12, 2:00 AM CDT', the page's claim deadline header"""
+    return f"{when:%a %b} {when.day}, {format_clock(when)} {zone}"
+
+def format_submitted(when):
+    """'Jun 10, 2:24 PM', the SUBMITTED (CDT) column"""
+    return f"{when:%b} {when.day}, {format_clock(when)}"
+
+def format_clock(when):
+    # No %-I: strftime padding flags differ on Windows
+    return f"{when.hour % 12 or 12}:{when.minute:02d} {'AM' if when.hour < 12 else 'PM'}"
+
+def player_names(count, rng):
+    """count distinct 'First Last' names, with a suffix once the pools run out"""
+    names = [f"{first} {last}" for last in LAST_NAMES for first in FIRST_NAMES]
+    rng.shuffle(names)
+    return [names[i % len(names)] + (f" {'I' * (i // len(names) + 1)}" if i >= len(names) else '')
+            for i in range(count)]
+
+def generate_league(teams=12, bids=100, drops=25, seed=0, deadline=DEFAULT_DEADLINE):
+    """getPendingTransactions data: bids claims spread over teams, drops of which also drop a player"""
+    rng = random.Random(seed)
+    names = player_names(bids + drops, rng)
+    claim_names, drop_names = names[:bids], names[bids:]
+    dropping = set(rng.sample(range(bids), min(drops, bids)))
+    
+    league_teams = [{'teamName': f"Team {number + 1}", 'claimBudget': rng.randint(0, 100), 'transactions': []}
+                    for number in range(max(1, teams))]
+    for index, name in enumerate(claim_names):
+        team = league_teams[rng.randrange(len(league_teams))]
+        submitted = deadline - timedelta(minutes=rng.randint(60, 3 * 24 * 60))
+        team['transactions'].append({
+            'claimScorer': {'name': name, 'posShortNames': rng.choice(POSITIONS), 'teamShortName': rng.choice(MLB_TEAMS)},
+            'priority': len(team['transactions']) + 1,
+            'bid': rng.randint(0, min(team['claimBudget'], 40)),
+            'submittedDate': format_submitted(submitted),
+            'dropScorer': ({'name': drop_names.pop(), 'posShortNames': rng.choice(POSITIONS),
+                            'teamShortName': rng.choice(MLB_TEAMS)} if index in dropping else None),
+        })
+    
+    return {'deadline': format_deadline(deadline), 'teams': league_teams}
+
+def render_text(league):
+    """The pending page's text, one value per line, in the layout pending_lexer expects"""
+    lines = []
+    for team in league['teams']:
+        lines += ["Free Agent Claims", league['deadline'], "Claim Budget Remaining:", f"${team['claimBudget']}"]
+        for transaction in team['transactions']:
+            claim = transaction['claimScorer']
+            lines += [claim['name'], claim['posShortNames'], f"- {claim['teamShortName']}",
+                      "PTY", str(transaction['priority']), "BID", str(transaction['bid']),
+                      "SUBMITTED (CDT)", transaction['submittedDate'],
+                      "POS", claim['posShortNames'].split(',')[0], "STA", "Res"]
+            drop = transaction.get('dropScorer')
+            if drop:
+                lines += [drop['name'], drop['posShortNames'], f"- {drop['teamShortName']}"]
+    return '\n'.join(lines)
+
+def render_scorer(scorer):
+    return (f'<scorer class="scorer scorer--round"><div class="scorer__info">'
+            f'<div class="scorer__info__name"><a tabindex="0">{escape(scorer["name"])}</a><!----></div>'
+            f'<div class="scorer__info__positions ng-star-inserted"><span>{scorer["posShortNames"]}</span><!---->'
+            f'<span class="mat-mdc-tooltip-trigger ng-star-inserted"> - <!----> {scorer["teamShortName"]} </span>'
+            f'</div></div></scorer>')
+
+def render_cell(head, value, extra=''):
+    return (f'<div class="supertable__cell text--center{extra}"><b class="supertable__cell__head">{head}</b>'
+            f'{value}</div>')
+
+def render_html(league):
+    """Pending page markup matching the selectors in fantrax_monitor.fetch (PENDING_ROWS_JS, ROW_SELECTOR)"""
+    # The title is what fetch.pending_page_loaded looks for
+    parts = ['<html><head><title>Pending Transactions - Fantrax</title></head><body><app-root>']
+    for team in league['teams']:
+        parts.append(
+            '<pending-transactions-table class="fx-layout__pane ng-star-inserted">'
+            f'<div class="sub-heading ng-star-inserted"><div><h4>Free Agent Claims</h4>'
+            f'<h5 class="mat-mdc-tooltip-trigger ng-star-inserted"> {league["deadline"]} </h5></div></div>'
+            '<div class="single-header single-header--sub-header ng-star-inserted"> Claim Budget Remaining: '
+            f'<b class="ng-star-inserted">${team["claimBudget"]}</b><!----></div>'
+            '<div cdkdroplist="" class="cdk-drop-list supertable supertable--pending-transaction-table ng-star-inserted">'
+            '<div class="supertable__head"><div class="supertable__cell"> Add <!----></div>'
+            '<div class="supertable__cell text--center">Pty</div><div class="supertable__cell text--center">Bid</div>'
+            '<div class="supertable__cell text--center">Submitted (CDT)</div><div class="supertable__cell text--center">Pos</div>'
+            '<div class="supertable__cell text--center">Sta</div><div class="supertable__cell">Drp/Mv</div></div>'
+        )
+        for transaction in team['transactions']:
+            claim = transaction['claimScorer']
+            drop = transaction.get('dropScorer')
+            parts.append(
+                '<div cdkdrag="" class="cdk-drag supertable__row ng-star-inserted">'
+                f'<div class="supertable__cell supertable__cell--ptt--50-mobile">{render_scorer(claim)}</div>'
+                + render_cell('Pty', f" {transaction['priority']} ", ' supertable__cell--ptt--order-10-mobile')
+                + render_cell('Bid', f'<input type="number" class="cell-input cell-input--bid" value="{transaction["bid"]}">')
+                + render_cell('Submitted (CDT)', f'<span class="mat-mdc-tooltip-trigger">{transaction["submittedDate"]}</span>')
+                + render_cell('Pos', f" {claim['posShortNames'].split(',')[0]} ")
+                + render_cell('Sta', " Res ")
+                + f'<div class="supertable__cell supertable__cell--ptt--75-mobile">{render_scorer(drop) if drop else ""}<!----></div>'
+                '</div>'
+            )
+        parts.append('</div></pending-transactions-table>')
+    parts.append('</app-root></body></html>')
+    return ''.join(parts)
+
+def render_recording(league, league_id=None):
+    """stub_server recording that serves this league to both backends
+
+    fantrax_http gets the login and getPendingTransactions JSON; the browser
+    backend gets render_html() at the league's pending page URL. The browser
+    needs a cached login cookie (any value) - the stub has no login form.
+    """
+    from fantrax_monitor.fetch import PENDING_PATH
+    return {
+        'description': f"Synthetic league: {len(league['teams'])} teams, "
+                       f"{sum(len(team['transactions']) for team in league['teams'])} claims",
+        'routes': [
+            {'method': 'POST', 'path': '/fxpa/req', 'fxpa': 'login', 'status': 200,
+             'headers': {'Set-Cookie': 'FX_RM=stub-session; Path=/'},
+             'body': {'responses': [{'data': {'userInfo': {'username': 'stub'}}}]}},
+            {'method': 'POST', 'path': '/fxpa/req', 'fxpa': 'getPendingTransactions', 'status': 200,
+             'body': {'responses': [{'data': league}]}},
+            {'method': 'GET', 'path': PENDING_PATH.format(league_id=league_id or LEAGUE_ID), 'status': 200,
+             'headers': {'Content-Type': 'text/html; charset=utf-8'}, 'body': render_html(league)},
+        ],
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a synthetic Fantrax pending-claims page")
+    parser.add_argument('--teams', type=int, default=12)
+    parser.add_argument('--bids', type=int, default=100)
+    parser.add_argument('--drops', type=int, default=25, help="how many claims also drop a player")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--html', help="write the pending page HTML here")
+    parser.add_argument('--text', help="write the pending page text here")
+    parser.add_argument('--recording', help="write a stub_server recording here")
+    args = parser.parse_args()
+    
+    league = generate_league(args.teams, args.bids, args.drops, args.seed)
+    outputs = [(args.html, render_html), (args.text, render_text),
+               (args.recording, lambda data: json.dumps(render_recording(data), indent=2))]
+    for path, render in outputs:
+        if path:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(render(league))
+            print(f"✓ Wrote {path}")
+    if not any(path for path, _ in outputs):
+        print(render_text(league))
@@ -0,0 +1,114 @@
+"""Wall-clock timing and counters for a monitor run, with a JSON/Prometheus run report"""
+import os
+import re
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from fantrax_monitor.file_utils import write_json_atomic
+
+RUN_REPORT = os.getenv('FANTRAX_RUN_REPORT', 'run_report.json')
+# node_exporter textfile collector file, e.g. /var/lib/node_exporter/fantrax.prom (off by default)
+PROMETHEUS_TEXTFILE = os.getenv('FANTRAX_PROMETHEUS_TEXTFILE')
+
+class PhaseTimer:
+    """Accumulates elapsed seconds per named phase, in the order phases first ran, plus counters
+
+    Phases may nest (parse runs inside extract), so the phase sum can exceed
+    the wall-clock time of the run; wall() is the real elapsed time.
+    """
+    
+    def __init__(self):
+        self.phases = {}
+        self.counters = {}
+        self.started_at = datetime.now()
+        self.start = time.perf_counter()
+    
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+    
+    def add_time(self, name, seconds):
+        """Record a span measured elsewhere (e.g. by MailTransport)"""
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+    
+    def count(self, name, amount=1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+    
+    def total(self):
+        return sum(self.phases.values())
+    
+    def wall(self):
+        return time.perf_counter() - self.start
+    
+    def report(self):
+        """Print one line per phase and counter plus the wall-clock total"""
+        print("Phase timings:")
+        for name, seconds in self.phases.items():
+            print(f"  {name:<16} {seconds:7.2f}s")
+        print(f"  {'total':<16} {self.wall():7.2f}s")
+        if self.counters:
+            print("Counters:")
+            for name, value in self.counters.items():
+                print(f"  {name:<20} {value:7d}")
+    
+    def to_dict(self, **labels):
+        return {
+            'started_at': self.started_at.isoformat(timespec='seconds'),
+            'wall_seconds': round(self.wall(), 4),
+            'phases': {name: round(seconds, 4) for name, seconds in self.phases.items()},
+            'counters': dict(self.counters),
+            **labels,
+        }
+    
+    def write_report(self, path=RUN_REPORT, prometheus_path=PROMETHEUS_TEXTFILE, **labels):
+        """Write the JSON run report (and the Prometheus textfile if configured)"""
+        try:
+            report = self.to_dict(**labels)
+            write_json_atomic(path, report)
+            if prometheus_path:
+                write_prometheus(prometheus_path, report)
+        except OSError as e:
+            print(f"⚠ Could not write run report: {e}")
+
+def prometheus_labels(labels):
+    # Only string labels (backend, league); numbers are reported as metrics
+    pairs = [f'{name}="{escape_label(value)}"' for name, value in labels.items() if isinstance(value, str)]
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+def escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def metric_name(name):
+    return re.sub(r'[^a-zA-Z0-9_]', '_', name)
+
+def write_prometheus(path, report):
+    """A to_dict() run report in Prometheus text format, written atomically for the textfile collector"""
+    base = {name: value for name, value in report.items() if isinstance(value, str) and name != 'started_at'}
+    started_at = datetime.fromisoformat(report['started_at'])
+    lines = [
+        "# HELP fantrax_run_wall_seconds Wall-clock duration of the last monitor run.",
+        "# TYPE fantrax_run_wall_seconds gauge",
+        f"fantrax_run_wall_seconds{prometheus_labels(base)} {report['wall_seconds']:.6f}",
+        "# HELP fantrax_run_timestamp_seconds When the last monitor run started.",
+        "# TYPE fantrax_run_timestamp_seconds gauge",
+        f"fantrax_run_timestamp_seconds{prometheus_labels(base)} {started_at.timestamp():.0f}",
+        "# HELP fantrax_phase_seconds Seconds spent in each phase of the last run.",
+        "# TYPE fantrax_phase_seconds gauge",
+    ]
+    for name, seconds in report['phases'].items():
+        lines.append(f"fantrax_phase_seconds{prometheus_labels(dict(base, phase=name))} {seconds:.6f}")
+    counters = dict(report['counters'])
+    if isinstance(report.get('players'), int):
+        counters.setdefault('players_found', report['players'])
+    for name, value in counters.items():
+        metric = f"fantrax_{metric_name(name)}"
+        lines += [f"# TYPE {metric} gauge", f"{metric}{prometheus_labels(base)} {value}"]
+    
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w') as f:
+        f.write('\n'.join(lines) + '\n')
+    os.replace(temp_path, path)
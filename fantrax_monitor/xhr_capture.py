@@ -0,0 +1,125 @@
+"""Read the pending claims straight from the app's own /fxpa/req XHR.
+
+The pending page is an Angular app that renders the table from a
+getPendingTransactions call. With Chrome's performance log enabled
+(chrome_driver.create_driver(performance_log=True)) the request shows up as
+Network.* events; the response body is pulled with Network.getResponseBody
+and turned into player dicts by fantrax_monitor.parse.parse_pending_transactions -
+no DOM text and no regex.
+
+    FANTRAX_EXTRACTION=xhr python fantrax_scraper.py
+    python -m fantrax_monitor.xhr_capture fixtures/pending_xhr_capture.json   # replay a recording
+"""
+import base64
+import json
+import time
+
+from fantrax_monitor.fantrax_http import PENDING_METHOD
+from fantrax_monitor.parse import PendingPayloadError, parse_pending_transactions
+
+def log_messages(entries):
+    """The DevTools message inside each performance log entry"""
+    for entry in entries:
+        try:
+            yield json.loads(entry['message'])['message']
+        except (KeyError, TypeError, ValueError):
+            continue
+
+def pending_request_index(post_data):
+    """Position of getPendingTransactions among the request's msgs, or None"""
+    try:
+        msgs = json.loads(post_data or '')['msgs']
+    except (KeyError, TypeError, ValueError):
+        return None
+    for index, msg in enumerate(msgs):
+        if isinstance(msg, dict) and msg.get('method') == PENDING_METHOD:
+            return index
+    return None
+
+def find_pending_requests(entries, get_post_data=None):
+    """(requestId, msg index) of finished getPendingTransactions calls, oldest first"""
+    sent = {}
+    finished = []
+    for message in log_messages(entries):
+        params = message.get('params') or {}
+        if message.get('method') == 'Network.requestWillBeSent':
+            request = params.get('request') or {}
+            if '/fxpa/req' not in request.get('url', ''):
+                continue
+            post_data = request.get('postData')
+            if post_data is None and request.get('hasPostData') and get_post_data:
+                post_data = get_post_data(params['requestId'])
+            index = pending_request_index(post_data)
+            if index is not None:
+                sent[params['requestId']] = index
+        elif message.get('method') == 'Network.loadingFinished' and params.get('requestId') in sent:
+            finished.append((params['requestId'], sent[params['requestId']]))
+    return finished
+
+def pending_data_from_body(body, index):
+    """The getPendingTransactions 'data' payload from an /fxpa/req response body"""
+    responses = json.loads(body).get('responses') or []
+    if index >= len(responses):
+        return None
+    return responses[index].get('data')
+
+def decode_body(result):
+    """Network.getResponseBody result -> text"""
+    body = result.get('body', '')
+    return base64.b64decode(body).decode('utf-8') if result.get('base64Encoded') else body
+
+def pending_data_from_log(entries, get_body, get_post_data=None):
+    """Latest getPendingTransactions payload found in the log entries, or None"""
+    for request_id, index in reversed(find_pending_requests(entries, get_post_data)):
+        try:
+            data = pending_data_from_body(decode_body(get_body(request_id)), index)
+        except Exception:
+            # Body evicted from Chrome's buffer, or not JSON - try an older call
+            continue
+        if data is not None:
+            return data
+    return None
+
+def capture_pending_data(driver, timeout=5, read_log=None):
+    """Wait up to timeout seconds for the pending-transactions XHR and return its payload
+
+    read_log drains the performance log (default driver.get_log('performance')).
+    """
+    get_body = lambda request_id: driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id})
+    get_post_data = lambda request_id: driver.execute_cdp_cmd(
+        'Network.getRequestPostData', {'requestId': request_id}).get('postData')
+    
+    # get_log() drains the buffer, so keep everything read so far
+    read_log = read_log or (lambda: driver.get_log('performance'))
+    entries = []
+    deadline = time.monotonic() + timeout
+    while True:
+        entries += read_log()
+        data = pending_data_from_log(entries, get_body, get_post_data)
+        if data is not None or time.monotonic() >= deadline:
+            return data
+        time.sleep(0.2)
+
+def capture_pending_players(driver, timeout=5, read_log=None):
+    """(players, raw deadline) from the XHR, or ([], None) if it was not seen or not understood"""
+    data = capture_pending_data(driver, timeout, read_log)
+    if data is None:
+        return [], None
+    try:
+        return parse_pending_transactions(data), data.get('deadline')
+    except PendingPayloadError as e:
+        print(f"⚠ Pending-transactions XHR not understood ({e})")
+        return [], None
+
+if __name__ == "__main__":
+    import sys
+    with open(sys.argv[1] if len(sys.argv) > 1 else 'fixtures/pending_xhr_capture.json', 'r') as f:
+        recording = json.load(f)
+    bodies = recording['response_bodies']
+    data = pending_data_from_log(recording['performance_log'], lambda request_id: bodies[request_id])
+    players = parse_pending_transactions(data) if data else []
+    print(f"Deadline: {data.get('deadline') if data else None}")
+    print(f"Found {len(players)} players being added:")
+    for i, player in enumerate(players, 1):
+        print(f"  {i}. {player['player_name']} ({player['position']}) - {player['team']}"
+              + (f" dropping {player['drop_player']}" if player['drop_player'] else ""))
@@ -3,7 +3,7 @@ cd /d "C:\Users\willi\OneDrive\Documents\VS Code Projects\Python scripts\Web Scr
 echo Starting Fantrax Auction Monitor...
 
 echo Running scraper...
-"C:\Users\willi\anaconda3\python.exe" Fantrax_Scrape_Process.py
+"C:\Users\willi\anaconda3\python.exe" fantrax_scraper.py
 
 echo Running email sender...
 "C:\Users\willi\anaconda3\python.exe" Email_Results.py
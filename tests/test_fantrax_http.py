@@ -0,0 +1,129 @@
+"""fantrax_http against stub_server: the recorded league, cached cookies and a rejected session."""
+import json
+from pathlib import Path
+
+import pytest
+import requests
+
+from fantrax_monitor.fantrax_http import FantraxRequestError, HttpSession, fetch_pending_players
+from fantrax_monitor.fetch import pending_url
+from fantrax_monitor.parse import PendingPayloadError, parse_pending_transactions
+from fantrax_monitor.pending_html import parse_pending_html
+from fantrax_monitor.recorder import Recorder
+from fantrax_monitor.stub_server import load_recording, start_stub_server
+from fantrax_monitor.synthetic_league import generate_league, render_recording
+
+FIXTURE = Path(__file__).resolve().parent.parent / 'fixtures' / 'pending_transactions.json'
+
+@pytest.fixture
+def serve(monkeypatch):
+    """Start a stub server for a recording and point fantrax_http at it"""
+    servers = []
+    
+    def start(recording):
+        server = start_stub_server(recording)
+        servers.append(server)
+        host, port = server.server_address[:2]
+        monkeypatch.setenv('FANTRAX_BASE_URL', f"http://{host}:{port}")
+        return server
+    
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+def test_fetch_pending_players_from_recording(serve):
+    serve(str(FIXTURE))
+    players, deadline = fetch_pending_players('user', 'secret', use_cache=False)
+    assert deadline == 'Thu Jun 12, 2:00 AM CDT'
+    assert [player['player_name'] for player in players] == [
+        'Jo Adell', 'Will Warren', 'Royce Lewis', 'Adrian Houser', 'Michael Kopech']
+    kopech = players[-1]
+    assert kopech['drop_player'] == 'Justin Martinez'
+    assert all(isinstance(player['priority'], int) for player in players)
+
+def test_synthetic_league_round_trip(serve):
+    league = generate_league(teams=12, bids=200, drops=50)
+    serve(render_recording(league))
+    players, _ = fetch_pending_players('user', 'secret', use_cache=False)
+    assert len(players) == 200
+    assert sum(1 for player in players if player['drop_player']) == 50
+
+def test_cached_cookies_skip_the_login(serve, tmp_path):
+    cookie_cache = str(tmp_path / 'cookies.json')
+    recording = load_recording(str(FIXTURE))
+    serve(recording)
+    session = HttpSession('user', 'secret', cookie_cache=cookie_cache)
+    try:
+        session.poll()
+    finally:
+        session.close()
+    assert 'FX_RM' in Path(cookie_cache).read_text()
+    
+    # No login route: a second login would get the stub's 404
+    serve({'routes': [route for route in recording['routes'] if route.get('fxpa') != 'login']})
+    session = HttpSession('user', 'secret', cookie_cache=cookie_cache)
+    try:
+        players, _ = session.poll()
+    finally:
+        session.close()
+    assert len(players) == 5
+
+def test_rejected_session_logs_in_again(serve, tmp_path):
+    cookie_cache = tmp_path / 'cookies.json'
+    cookie_cache.write_text(json.dumps([{'domain': '127.0.0.1', 'name': 'FX_RM', 'value': 'expired', 'path': '/'}]))
+    login, pending = load_recording(str(FIXTURE))['routes']
+    rejected = {'method': 'POST', 'path': '/fxpa/req', 'fxpa': 'getPendingTransactions', 'status': 200,
+                'body': {'pageError': {'code': 'WARNING_NOT_LOGGED_IN'}}}
+    serve({'routes': [rejected, login, pending]})
+    session = HttpSession('user', 'secret', cookie_cache=str(cookie_cache))
+    try:
+        players, _ = session.poll()
+    finally:
+        session.close()
+    assert len(players) == 5
+    assert 'stub-session' in cookie_cache.read_text()
+
+def test_unrecognised_payload_fails_instead_of_looking_empty(serve):
+    login, pending = load_recording(str(FIXTURE))['routes']
+    renamed = dict(pending, body={'responses': [{'data': {'deadline': 'Thu Jun 12, 2:00 AM CDT', 'rosters': []}}]})
+    serve({'routes': [login, renamed]})
+    with pytest.raises(FantraxRequestError, match="no 'teams' list"):
+        fetch_pending_players('user', 'secret', use_cache=False)
+
+def test_transaction_without_claim_scorer_is_rejected():
+    data = {'teams': [{'teamName': 'Jobu', 'transactions': [{'player': {'name': 'Jo Adell'}, 'bid': 4}]}]}
+    with pytest.raises(PendingPayloadError, match='claimScorer'):
+        parse_pending_transactions(data)
+
+def test_league_with_no_claims_is_still_empty():
+    assert parse_pending_transactions({'teams': [], 'deadline': None}) == []
+
+def test_stub_serves_the_rendered_pending_page(serve):
+    league = generate_league(teams=4, bids=40, drops=10)
+    serve(render_recording(league))
+    response = requests.get(pending_url(), timeout=5)
+    assert response.status_code == 200
+    assert 'Pending Transactions' in response.text
+    rows = parse_pending_html(response.text)
+    assert len(rows) == 40
+    assert [row['bid'] for row in rows] == [transaction['bid'] for team in league['teams']
+                                            for transaction in team['transactions']]
+
+def test_recorder_writes_once_at_save(serve, tmp_path):
+    league = generate_league(teams=4, bids=40, drops=10)
+    serve(render_recording(league))
+    path = tmp_path / 'run.json'
+    recorder = Recorder(str(path))
+    session = requests.Session()
+    session.hooks['response'].append(recorder.record_response)
+    for _ in range(3):
+        assert session.get(pending_url(), timeout=5).status_code == 200
+    assert not path.exists()
+    recorder.save()
+    routes = load_recording(str(path))['routes']
+    assert len(routes) == 3
+    assert 'Pending Transactions' in routes[0]['body']
+    modified = path.stat().st_mtime_ns
+    recorder.save()
+    assert path.stat().st_mtime_ns == modified
@@ -0,0 +1,118 @@
+"""Browser-path helpers in fantrax_monitor.fetch that run without Chrome."""
+import json
+
+from fantrax_monitor import bid_history, snapshot_state
+from fantrax_monitor.fetch import (DEFAULT_TIMEOUTS, ELEMENT_PARENTS_JS, PENDING_ROWS_JS, extract_pending_rows,
+                                   load_timeouts, record_history, walk_elements_for_players)
+from fantrax_monitor.parse import parse_pending_transactions
+from fantrax_monitor.synthetic_league import generate_league, render_text
+from fantrax_monitor.timing import PhaseTimer
+
+def test_timeouts_from_config_and_environment(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'config.json').write_text(json.dumps({'timeouts': {'home': 30, 'xhr': '7.5'}}))
+    monkeypatch.setenv('FANTRAX_TIMEOUT_HOME', '3')
+    timeouts = load_timeouts()
+    assert timeouts['home'] == 3.0
+    assert timeouts['xhr'] == 7.5
+    assert timeouts['pending_table'] == DEFAULT_TIMEOUTS['pending_table']
+
+def test_malformed_timeouts_keep_the_default(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'config.json').write_text(json.dumps({'timeouts': {'login_modal': 'slow'}}))
+    monkeypatch.setenv('FANTRAX_TIMEOUT_XHR', 'abc')
+    timeouts = load_timeouts()
+    assert timeouts['xhr'] == DEFAULT_TIMEOUTS['xhr']
+    assert timeouts['login_modal'] == DEFAULT_TIMEOUTS['login_modal']
+    output = capsys.readouterr().out
+    assert "FANTRAX_TIMEOUT_XHR timeout 'abc'" in output
+    assert "config.json timeout 'slow'" in output
+
+class FakeElement:
+    def __init__(self, text):
+        self._text = text
+        self.reads = 0
+    
+    @property
+    def text(self):
+        self.reads += 1
+        return self._text
+
+class FakeDriver:
+    """find_elements('*') and ELEMENT_PARENTS_JS over a fixed element list, no bid-row markup"""
+    
+    def __init__(self, elements, parents):
+        self.elements = elements
+        self.parents = parents
+    
+    def find_elements(self, by, selector):
+        return self.elements if selector == '*' else []
+    
+    def execute_script(self, script):
+        assert script == ELEMENT_PARENTS_JS
+        return self.parents
+
+def nested_page():
+    """html > body > (team section > claim block, team section) with each element's full text"""
+    league = generate_league(teams=2, bids=4, drops=1)
+    first, second = ({'deadline': league['deadline'], 'teams': [team]} for team in league['teams'])
+    claim = dict(first, teams=[dict(first['teams'][0], transactions=first['teams'][0]['transactions'][:1])])
+    texts = [render_text(league), render_text(league), render_text(first), render_text(claim), render_text(second)]
+    return [FakeElement(text) for text in texts], [-1, 0, 1, 2, 1]
+
+def test_element_walk_skips_descendants_of_a_kept_text():
+    elements, parents = nested_page()
+    timer = PhaseTimer()
+    players = walk_elements_for_players(FakeDriver(elements, parents), timer)
+    assert len(players) == 4
+    assert [element.reads for element in elements] == [1, 0, 0, 0, 0]
+    assert timer.counters['elements_scanned'] == 1
+    assert timer.counters['texts_parsed'] == 1
+
+def test_element_walk_without_parents_still_parses_each_bid_once():
+    elements, _ = nested_page()
+    timer = PhaseTimer()
+    players = walk_elements_for_players(FakeDriver(elements, []), timer)
+    assert len(players) == 4
+    assert all(element.reads == 1 for element in elements)
+    assert timer.counters['duplicates_dropped'] > 0
+
+def history_rows():
+    conn = bid_history.connect(bid_history.HISTORY_DB)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM bids").fetchone()[0]
+    finally:
+        conn.close()
+
+def test_unchanged_snapshot_is_not_appended_to_history(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    league = generate_league(teams=2, bids=6, drops=2)
+    players = parse_pending_transactions(league)
+    deadline = league['deadline']
+    
+    for _ in range(3):
+        change = snapshot_state.record_snapshot('league', deadline, players)
+        record_history('league', deadline, players, change)
+    assert history_rows() == 6
+    
+    players[0]['bid'] += 1
+    change = snapshot_state.record_snapshot('league', deadline, players)
+    record_history('league', deadline, players, change)
+    assert history_rows() == 12
+
+class ScriptDriver:
+    def __init__(self, rows):
+        self.rows = rows
+    
+    def execute_script(self, script):
+        assert script == PENDING_ROWS_JS
+        return self.rows
+
+def test_script_extraction_counts_rows_not_elements():
+    rows = [{'player_name': 'Jo Adell', 'priority': '1', 'bid': '4', 'claim_budget': '31'},
+            {'player_name': '', 'priority': None, 'bid': None, 'claim_budget': None}]
+    timer = PhaseTimer()
+    players = extract_pending_rows(ScriptDriver(rows), timer)
+    assert [player['player_name'] for player in players] == ['Jo Adell']
+    assert players[0]['bid'] == 4
+    assert timer.counters == {'script_rows': 2}
@@ -0,0 +1,118 @@
+"""MailTransport against a local SMTP stand-in that can drop the connection mid-run."""
+import socketserver
+import threading
+from email.message import EmailMessage
+
+import pytest
+
+from fantrax_monitor.mail_transport import MailTransport, transport_from_config
+from fantrax_monitor.timing import PhaseTimer
+
+class StandInSMTP(socketserver.ThreadingTCPServer):
+    """Just enough SMTP for smtplib: no TLS or AUTH, and an optional drop after every N messages"""
+    daemon_threads = True
+    allow_reuse_address = True
+    
+    def __init__(self, drop_after=None):
+        super().__init__(('127.0.0.1', 0), SMTPHandler)
+        self.drop_after = drop_after
+        self.connections = 0
+        self.messages = []
+        self.lock = threading.Lock()
+
+class SMTPHandler(socketserver.StreamRequestHandler):
+    def reply(self, line):
+        self.wfile.write(f"{line}\r\n".encode('ascii'))
+    
+    def handle(self):
+        server = self.server
+        with server.lock:
+            server.connections += 1
+        self.reply('220 stand-in ready')
+        delivered = 0
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode('ascii').strip().upper()
+            if command.startswith(('EHLO', 'HELO')):
+                self.reply('250 stand-in')
+            elif command == 'DATA':
+                self.reply('354 end with <CRLF>.<CRLF>')
+                body = []
+                for data in iter(self.rfile.readline, b''):
+                    if data == b'.\r\n':
+                        break
+                    body.append(data)
+                with server.lock:
+                    server.messages.append(b''.join(body).decode('utf-8'))
+                self.reply('250 queued')
+                delivered += 1
+                if server.drop_after and delivered >= server.drop_after:
+                    # Hang up without QUIT, the way an idle timeout does
+                    return
+            elif command == 'QUIT':
+                self.reply('221 bye')
+                return
+            else:
+                self.reply('250 ok')
+
+@pytest.fixture
+def smtp_server(request):
+    server = StandInSMTP(getattr(request, 'param', None))
+    threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+def make_message(number):
+    msg = EmailMessage()
+    msg['Subject'] = f"Alert {number}"
+    msg['From'] = 'monitor@example.com'
+    msg['To'] = 'owner@example.com'
+    msg.set_content(f"Body {number}")
+    return msg
+
+def send_all(server, count, timer=None):
+    host, port = server.server_address
+    with MailTransport(host, port, starttls=False, timer=timer) as transport:
+        for number in range(1, count + 1):
+            transport.send(make_message(number))
+    return transport
+
+def test_one_connection_for_every_message(smtp_server):
+    transport = send_all(smtp_server, 3)
+    assert smtp_server.connections == 1
+    assert len(smtp_server.messages) == 3
+    assert [subject for subject, _ in transport.latencies] == ['Alert 1', 'Alert 2', 'Alert 3']
+    assert transport.server is None
+
+@pytest.mark.parametrize('smtp_server', [2], indirect=True)
+def test_reconnects_when_the_server_drops(smtp_server):
+    transport = send_all(smtp_server, 5)
+    assert len(smtp_server.messages) == 5
+    assert all(f"Body {number}" in smtp_server.messages[number - 1] for number in range(1, 6))
+    assert smtp_server.connections == 3
+    assert len(transport.latencies) == 5
+
+def test_latency_is_timed_per_message(smtp_server, capsys):
+    timer = PhaseTimer()
+    transport = send_all(smtp_server, 2, timer)
+    assert timer.counters['emails_sent'] == 2
+    assert timer.phases['smtp_send'] == pytest.approx(sum(seconds for _, seconds in transport.latencies))
+    assert timer.phases['smtp_connect'] == pytest.approx(transport.connect_seconds)
+    
+    transport.report()
+    output = capsys.readouterr().out
+    assert 'SMTP connect/auth' in output
+    assert 'Alert 1' in output and 'Alert 2' in output
+
+def test_transport_from_config(smtp_server):
+    host, port = smtp_server.server_address
+    config = {'smtp_server': host, 'smtp_port': str(port), 'smtp_starttls': False,
+              'sender_email': 'monitor@example.com', 'sender_password': ''}
+    with transport_from_config(config) as transport:
+        transport.send(make_message(1))
+    assert transport.starttls is False
+    assert smtp_server.connections == 1
+    assert len(smtp_server.messages) == 1
@@ -0,0 +1,47 @@
+"""Priority, bid and claim budget as ints from every pending-page extractor."""
+from pathlib import Path
+
+from fantrax_monitor.parse import parse_pending_transactions
+from fantrax_monitor.pending_html import parse_pending_html
+from fantrax_monitor.pending_lexer import parse_pending_text
+from fantrax_monitor.synthetic_league import generate_league, render_html, render_text
+
+ROOT = Path(__file__).resolve().parent.parent
+
+def expected_claims(league):
+    """(player, club, priority, bid, claim budget) for every claim in a synthetic league"""
+    return sorted((transaction['claimScorer']['name'], transaction['claimScorer']['teamShortName'],
+                   transaction['priority'], transaction['bid'], team['claimBudget'])
+                  for team in league['teams'] for transaction in team['transactions'])
+
+def claims(rows):
+    for row in rows:
+        for field in ('priority', 'bid', 'claim_budget'):
+            assert type(row[field]) is int, (field, row)
+    return sorted((row['player_name'], row['team'], row['priority'], row['bid'], row['claim_budget']) for row in rows)
+
+def test_pending_html_rows_from_synthetic_page():
+    league = generate_league(teams=6, bids=120, drops=30)
+    assert claims(parse_pending_html(render_html(league))) == expected_claims(league)
+
+def test_pending_lexer_rows_from_synthetic_text():
+    league = generate_league(teams=6, bids=120, drops=30)
+    rows = parse_pending_text(render_text(league))
+    # Two-letter clubs (SD, SF, TB) keep their team
+    assert {'SD', 'SF', 'TB'} <= {row['team'] for row in rows}
+    assert claims(rows) == expected_claims(league)
+
+def test_pending_html_page_source_capture():
+    rows = parse_pending_html((ROOT / 'page_source.html').read_text(encoding='utf-8'))
+    assert [(row['player_name'], row['priority'], row['claim_budget']) for row in rows] == [
+        ('Davis Martin', 1, 31), ('Jo Adell', 2, 31), ('AJ Smith-Shawver', 3, 31)]
+
+def test_json_numbers_become_ints():
+    league = generate_league(teams=3, bids=20, drops=5)
+    expected = expected_claims(league)
+    for team in league['teams']:
+        team['claimBudget'] = f"${team['claimBudget']}"
+        for transaction in team['transactions']:
+            transaction['priority'] = str(transaction['priority'])
+            transaction['bid'] = f" {transaction['bid']} "
+    assert claims(parse_pending_transactions(league)) == expected
@@ -0,0 +1,55 @@
+"""Subscriber routing from config: filters, and email_to split into its addresses."""
+from fantrax_monitor.notify import send_summary
+from fantrax_monitor.subscriptions import index_from_config, split_addresses, unlisted_email_to
+
+PITCHER = {'player_name': 'Will Warren', 'position': 'SP', 'team': 'NYY'}
+HITTER = {'player_name': 'Jo Adell', 'position': 'OF', 'team': 'LAA'}
+
+CONFIG = {
+    'sender_email': 'monitor@example.com',
+    'smtp_server': 'smtp.example.com',
+    'email_subject': 'Fantrax Auctions',
+    'email_to': 'me@example.com; Pitching@example.com ;',
+    'email_cc': 'cc@example.com',
+    'subscribers': [
+        {'email': 'pitching@example.com', 'positions': ['SP', 'RP']},
+        {'email': 'fan@example.com', 'teams': ['LAA']},
+    ],
+}
+
+class FakeTransport:
+    def __init__(self):
+        self.sent = []
+    
+    def send(self, msg, from_addr=None, to_addrs=None):
+        self.sent.append((msg['To'], msg['Cc'], to_addrs))
+        return 0.0
+
+def test_split_addresses():
+    assert split_addresses(' a@example.com;b@example.com ; ') == ['a@example.com', 'b@example.com']
+    assert split_addresses(None) == []
+
+def test_email_to_addresses_are_matched_one_by_one():
+    assert unlisted_email_to(CONFIG) == 'me@example.com'
+    index = index_from_config(CONFIG)
+    assert index.emails == ['pitching@example.com', 'fan@example.com', 'me@example.com']
+    routed = index.route([PITCHER, HITTER])
+    # pitching@ is in email_to too, but its subscriber filters still apply
+    assert routed == {'pitching@example.com': [PITCHER], 'fan@example.com': [HITTER],
+                      'me@example.com': [PITCHER, HITTER]}
+
+def test_email_to_listed_in_full_adds_no_subscriber():
+    config = dict(CONFIG, email_to='PITCHING@example.com; fan@example.com')
+    assert unlisted_email_to(config) == ''
+    assert index_from_config(config).emails == ['pitching@example.com', 'fan@example.com']
+
+def test_email_cc_rides_on_the_unlisted_email_to_message(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    transport = FakeTransport()
+    for email in index_from_config(CONFIG).emails:
+        assert send_summary(CONFIG, 'body', transport=transport, to=email, mark=False)
+    assert transport.sent == [
+        ('pitching@example.com', None, ['pitching@example.com']),
+        ('fan@example.com', None, ['fan@example.com']),
+        ('me@example.com', 'cc@example.com', ['me@example.com', 'cc@example.com']),
+    ]
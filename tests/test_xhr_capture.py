@@ -0,0 +1,36 @@
+"""Replay the recorded pending-transactions XHR through the capture and JSON parser."""
+import json
+from pathlib import Path
+
+from fantrax_monitor.parse import parse_pending_transactions
+from fantrax_monitor.xhr_capture import pending_data_from_log
+
+FIXTURE = Path(__file__).resolve().parent.parent / 'fixtures' / 'pending_xhr_capture.json'
+
+def load_capture():
+    with open(FIXTURE, 'r') as f:
+        recording = json.load(f)
+    bodies = recording['response_bodies']
+    return pending_data_from_log(recording['performance_log'], lambda request_id: bodies[request_id])
+
+def test_capture_finds_the_pending_response():
+    data = load_capture()
+    assert data is not None
+    assert data['deadline'] == 'Thu Jun 12, 2:00 AM CDT'
+
+def test_every_claim_is_parsed_once():
+    players = parse_pending_transactions(load_capture())
+    assert [player['player_name'] for player in players] == [
+        'Jo Adell', 'Will Warren', 'Royce Lewis', 'Adrian Houser', 'Michael Kopech']
+    assert all(player['deadline'] == 'Thu Jun 12, 2:00 AM CDT' for player in players)
+
+def test_drop_player_stays_with_its_claim():
+    players = {player['player_name']: player for player in parse_pending_transactions(load_capture())}
+    assert players['Michael Kopech']['drop_player'] == 'Justin Martinez'
+    assert players['Michael Kopech']['team'] == 'LAD'
+    assert [name for name, player in players.items() if player['drop_player']] == ['Michael Kopech']
+
+def test_missing_response_body_is_not_a_capture():
+    with open(FIXTURE, 'r') as f:
+        recording = json.load(f)
+    assert pending_data_from_log(recording['performance_log'], lambda request_id: None) is None